@@ -0,0 +1,382 @@
+# ==========================================
+# DATEI: Benchmark_Suite.py
+# ZEITSTEMPEL: 20.10.2026 - 10:10 Uhr
+#
+# BESCHREIBUNG:
+# Benchmarks für Berechnung, Diagramme und PDF-Bericht (ohne Browser, läuft
+# auf einem normalen Linux-Rechner). Jede Messung läuft in mehreren Größen
+# (1, 100, 10.000 Gebäude), das Ergebnis wird als JSON gespeichert und mit
+# einer gespeicherten Baseline verglichen.
+#
+# AUFRUF:
+#   python Benchmark_Suite.py                      -> messen + mit Baseline vergleichen
+#   python Benchmark_Suite.py --save-baseline      -> aktuelle Messung als Baseline speichern
+#   python Benchmark_Suite.py --threshold 15       -> Fehler ab +15 % (Standard: 20 %)
+#   python Benchmark_Suite.py --only pdf,charts    -> nur ausgewählte Benchmarks
+#   python Benchmark_Suite.py --full               -> schwere Benchmarks mit voller Gebäude-Anzahl
+#   python Benchmark_Suite.py --pruefen            -> nur Korrektheit: Kaskade gegen Brute Force,
+#                                                     deutsches Zahlenformat der CSV-Importe
+#
+# Exit-Code 1, wenn ein Benchmark (schnellste Wiederholung) langsamer als die Baseline + Toleranz ist
+# bzw. mit --pruefen, wenn eine Prüfung fehlschlägt.
+# ==========================================
+
+import argparse
+import itertools
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+from datetime import datetime
+
+import matplotlib
+matplotlib.use("Agg")  # Kein Display nötig
+
+import numpy as np
+
+import Waermepumpen_Auslegung as wp
+import WP_Quick_Kalkulator as quickie
+import WP_Kaskade as kaskade
+import WP_Export as export
+
+SKALEN = (1, 100, 10000)
+# Kaskade/Plotly ~10 ms, PDF/Matplotlib ~0,5 s pro Gebäude -> schwere Benchmarks laufen
+# mit höchstens SKALEN_MAX_SCHWER Gebäuden pro Batch (außer mit --full), dafür immer
+# mindestens MIN_WIEDERHOLUNGEN mal -> stabiler Median für den Baseline-Vergleich
+SKALEN_MAX_SCHWER = 20
+MIN_WIEDERHOLUNGEN = 3
+
+BASELINE_DATEI = "benchmark_baseline.json"
+ERGEBNIS_DATEI = "benchmark_ergebnisse.json"
+
+STANDARDS_WM2 = (150, 100, 60, 50, 30)
+
+
+# ==========================================
+# 1. TESTDATEN (reproduzierbar)
+# ==========================================
+def erzeuge_gebaeude(anzahl, seed=42):
+    """Zufällige, aber feste Gebäude im Wertebereich der Eingabemasken"""
+    rng = np.random.default_rng(seed)
+    gebaeude = []
+    for _ in range(anzahl):
+        hat_ww = bool(rng.integers(0, 2))
+        personen = int(rng.integers(1, 21)) if hat_ww else 0
+        gebaeude.append({
+            "flaeche": int(rng.integers(5, 201)) * 10,
+            "wm2": int(rng.choice(STANDARDS_WM2)),
+            "personen": personen,
+            "ww_faktor": (1.45 * 2.0 * 365) / 2400 if hat_ww else 0,
+            "sperrzeit": int(rng.integers(0, 13)),
+            "norm_temp": int(rng.integers(-25, 1)),
+            "vl_temp": int(rng.integers(30, 81)),
+            "bivalenz": int(rng.integers(-20, 1)),
+            # Quickie: Gas-Verbrauch (kWh) und Kesselwirkungsgrad
+            "verbrauch_kwh": float(rng.integers(15000, 200001)),
+            "wirkungsgrad": int(rng.integers(60, 106)) / 100,
+            "quickie_personen": int(rng.integers(1, 7)),
+        })
+    return gebaeude
+
+
+def erzeuge_katalog(anzahl=300, seed=42):
+    """Zufälliger WP-Katalog (3-120 kW, 12-45 % Modulation) für den Kaskaden-Benchmark"""
+    rng = np.random.default_rng(seed)
+    katalog = []
+    for i in range(anzahl):
+        kw = float(rng.uniform(3, 120))
+        katalog.append({"modell": f"M{i}", "kw_max": round(kw, 1), "kw_min": round(kw * float(rng.uniform(0.12, 0.45)), 1),
+                        "preis": round(3000 + 450 * kw ** 0.85 * float(rng.uniform(0.8, 1.4)))})
+    return katalog
+
+
+def _auslegung(g):
+    return wp.berechne_auslegung(g["flaeche"], g["wm2"], g["personen"], g["ww_faktor"], g["sperrzeit"])
+
+
+# ==========================================
+# 2. BENCHMARKS (eine Funktion verarbeitet die ganze Liste)
+# ==========================================
+def bench_calculate_heizlast(gebaeude):
+    for g in gebaeude:
+        quickie.calculate_heizlast(g["verbrauch_kwh"], g["wirkungsgrad"], True, g["quickie_personen"])
+
+
+def bench_auslegung(gebaeude):
+    for g in gebaeude:
+        _auslegung(g)
+
+
+def bench_lastkurve(gebaeude):
+    for g in gebaeude:
+        _, load_ww, _, load_real, _, _ = _auslegung(g)
+        x_temps = np.linspace(g["norm_temp"] - 5, 20, 100)
+        wp.berechne_lastkurve(x_temps, load_real, load_ww, g["norm_temp"])
+
+
+def bench_kaskade(gebaeude):
+    katalog = erzeuge_katalog()
+    for g in gebaeude:
+        _, load_ww, _, load_real, total_kw, _ = _auslegung(g)
+        kaskade.optimiere_kaskade(total_kw, wp.kaskaden_teillast(load_real, load_ww, g["norm_temp"]), katalog)
+
+
+def bench_portfolio_xlsx(gebaeude):
+    """Ein Portfolio-Workbook (write_only) mit einer Zeile pro Gebäude"""
+    zeilen = ({"projekt": f"Gebäude {i}", "flaeche": g["flaeche"], "wm2": g["wm2"], "personen": g["personen"],
+               "sperrzeit": g["sperrzeit"], "norm_temp": g["norm_temp"]} for i, g in enumerate(gebaeude))
+    export.portfolio_xlsx(wp.portfolio_zeilen(zeilen))
+
+
+def bench_plotly(gebaeude):
+    """Figuren bauen und serialisieren (das, was st.plotly_chart pro Rerun verschickt).
+    Ein gemeinsamer speicher entspricht einer Sitzung mit vielen Reruns."""
+    speicher = {}
+    for g in gebaeude:
+        base, load_ww, _, load_real, _, sperr = _auslegung(g)
+        wp.plot_leistungs_pie(base, load_ww, sperr, speicher).to_json()
+        wp.plot_heizlast_verlauf(load_real, load_ww, g["norm_temp"], g["bivalenz"], speicher).to_json()
+        quickie.plot_energy_pie(g["verbrauch_kwh"] * 0.6, load_ww * 2400, g["verbrauch_kwh"] * 0.2, speicher).to_json()
+
+
+def bench_charts(gebaeude):
+    for g in gebaeude:
+        base, load_ww, _, load_real, total_kw, sperr = _auslegung(g)
+        pfade = wp.create_charts_for_pdf(load_real, load_ww, sperr, g["norm_temp"], g["bivalenz"], total_kw)
+        for p in pfade:
+            try: os.remove(p)
+            except OSError: pass
+
+
+def bench_pdf(gebaeude):
+    for g in gebaeude:
+        base, load_ww, _, load_real, total_kw, sperr = _auslegung(g)
+        wp.create_pdf_report("Benchmark", "Bench", "Coolsulting", g["flaeche"], "Standard Bestand", g["wm2"], total_kw,
+                             load_real, load_ww, sperr, g["sperrzeit"],
+                             g["norm_temp"], g["vl_temp"], "Radiatoren (Heizkörper)", g["bivalenz"], "Heizstab",
+                             ["✅ Vorlauftemperatur optimal."], [], [])
+
+
+BENCHMARKS = {
+    "calculate_heizlast": (bench_calculate_heizlast, False),
+    "auslegung": (bench_auslegung, False),
+    "lastkurve": (bench_lastkurve, False),
+    "kaskade": (bench_kaskade, True),
+    "portfolio_xlsx": (bench_portfolio_xlsx, False),
+    "plotly": (bench_plotly, True),
+    "charts": (bench_charts, True),
+    "pdf": (bench_pdf, True),
+}
+
+
+# ==========================================
+# 3. MESSEN, SPEICHERN, VERGLEICHEN
+# ==========================================
+def messen(funktion, gebaeude, wiederholungen):
+    zeiten = []
+    for _ in range(wiederholungen):
+        start = time.perf_counter()
+        funktion(gebaeude)
+        zeiten.append(time.perf_counter() - start)
+    median = statistics.median(zeiten)
+    return {
+        "anzahl": len(gebaeude),
+        "wiederholungen": wiederholungen,
+        "median_s": median,
+        "min_s": min(zeiten),
+        "pro_gebaeude_ms": median / len(gebaeude) * 1000,
+    }
+
+
+def alle_messen(namen, skalen, wiederholungen, full):
+    ergebnisse = {}
+    testdaten = {n: erzeuge_gebaeude(n) for n in skalen}
+    for name in namen:
+        funktion, schwer = BENCHMARKS[name]
+        # Schwere Benchmarks: Batch verkleinern statt Wiederholungen streichen
+        groessen = skalen if full or not schwer else sorted({min(n, SKALEN_MAX_SCHWER) for n in skalen})
+        for n in groessen:
+            if n not in testdaten:
+                testdaten[n] = erzeuge_gebaeude(n)
+            # Große bzw. teure Batches MIN_WIEDERHOLUNGEN mal, kleine öfter
+            wdh = MIN_WIEDERHOLUNGEN if n >= 10000 or (schwer and n > 1) else max(wiederholungen, MIN_WIEDERHOLUNGEN)
+            ergebnis = messen(funktion, testdaten[n], wdh)
+            ergebnisse[f"{name}@{n}"] = ergebnis
+            print(f"{name:<20} n={n:<6} median {ergebnis['median_s'] * 1000:10.2f} ms   "
+                  f"({ergebnis['pro_gebaeude_ms']:.4f} ms/Gebäude)")
+    return ergebnisse
+
+
+def vergleichen(aktuell, baseline, toleranz_prozent):
+    """Liefert die Liste der Regressionen (Schlüssel, alt, neu, Prozent).
+    Verglichen wird die schnellste Wiederholung: Störungen durch andere Prozesse
+    machen Läufe nur langsamer, das Minimum schwankt deutlich weniger als der Median."""
+    regressionen = []
+    for schluessel, neu in aktuell.items():
+        alt = baseline.get(schluessel)
+        if not alt or alt["min_s"] <= 0:
+            continue
+        prozent = (neu["min_s"] / alt["min_s"] - 1) * 100
+        if prozent > toleranz_prozent:
+            regressionen.append((schluessel, alt["min_s"], neu["min_s"], prozent))
+    return regressionen
+
+
+def speichern(pfad, ergebnisse):
+    daten = {
+        "meta": {
+            "zeitpunkt": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "plattform": platform.platform(),
+        },
+        "ergebnisse": ergebnisse,
+    }
+    with open(pfad, "w", encoding="utf-8") as f:
+        json.dump(daten, f, indent=2, ensure_ascii=False)
+
+
+# ==========================================
+# 4. KORREKTHEIT (--pruefen)
+# Schnelle Suche (Pruning + gerundetes Memo) gegen vollständige Aufzählung auf kleinen
+# Katalogen; eine teurere Kaskade als nötig fällt hier auf, nicht erst im Angebot.
+# ==========================================
+PRUEF_KATALOGE = 6      # Zufalls-Kataloge ...
+PRUEF_MODELLE = 18      # ... mit je so vielen Modellen
+PRUEF_GEBAEUDE = 8      # Gebäude pro Katalog
+PRUEF_MAX_GERAETE = (3, 4)
+
+
+def kaskade_brute_force(total_kw, teillast, katalog, max_geraete):
+    """Günstigster Preis über alle Multimengen (gleiche Fallbacks wie optimiere_kaskade) oder None"""
+    mindestlast, auslegungslast = kaskade.lastbereich(total_kw, teillast)
+    kleinstes_min = min(g["kw_min"] for g in katalog)
+    grenzen = (mindestlast,) if kleinstes_min <= mindestlast + 1e-9 else (kleinstes_min, math.inf)
+    for grenze in grenzen:
+        preise = [sum(g["preis"] for g in auswahl)
+                  for r in range(1, max_geraete + 1)
+                  for auswahl in itertools.combinations_with_replacement(katalog, r)
+                  if kaskade.kaskade_pruefen(auswahl, grenze, auslegungslast)]
+        if preise:
+            return min(preise)
+    return None
+
+
+def pruefe_kaskade():
+    fehler = []
+    faelle = 0
+    for seed in range(PRUEF_KATALOGE):
+        katalog = erzeuge_katalog(PRUEF_MODELLE, seed=seed)
+        for g in erzeuge_gebaeude(PRUEF_GEBAEUDE, seed=100 + seed):
+            _, load_ww, _, load_real, total_kw, _ = _auslegung(g)
+            teillast = wp.kaskaden_teillast(load_real, load_ww, g["norm_temp"])
+            for max_geraete in PRUEF_MAX_GERAETE:
+                faelle += 1
+                ergebnis = kaskade.optimiere_kaskade(total_kw, teillast, katalog, max_geraete)
+                schnell = None if ergebnis is None else ergebnis["preis"]
+                erwartet = kaskade_brute_force(total_kw, teillast, katalog, max_geraete)
+                if (schnell is None) != (erwartet is None) or (schnell is not None and schnell > erwartet + 1e-6):
+                    fehler.append(f"Kaskade (Katalog {seed}, {total_kw:.2f} kW, max {max_geraete}): "
+                                  f"Suche {schnell} EUR, Brute Force {erwartet} EUR")
+    return faelle, fehler
+
+
+# (Beschreibung, CSV, erwartete Werte bzw. None = Zeile muss verworfen werden)
+PRUEF_KATALOG_CSV = (
+    ("Tausenderpunkt", "Modell;kW max;kW min;Preis\nA;8;2,4;12.500\n", (8.0, 2.4, 12500.0)),
+    ("Tausender + Dezimalkomma", "A;1.200,5;300;120.000,50\n", (1200.5, 300.0, 120000.5)),
+    ("12.5 mehrdeutig", "Modell;kW max;kW min;Preis\nA;12.5;3;10000\n", None),
+    ("Komma-CSV mit Dezimalpunkt", "Modell,kW max,kW min,Preis\nA,8,2.4,12500\n", (8.0, 2.4, 12500.0)),
+)
+PRUEF_PORTFOLIO_CSV = (
+    ("Tausenderpunkt", "Projekt;Fläche;W/m²\nA;1.200,5;50\n", (1200.5, 50.0)),
+    ("12.5 mehrdeutig", "Projekt;Fläche;W/m²\nA;12.5;50\n", None),
+    ("Personen negativ", "Projekt;Fläche;W/m²;Personen\nA;150;60;-5\n", None),
+    ("Normtemp ab Heizgrenze", "Projekt;Fläche;W/m²;Personen;Sperrzeit;Normtemp\nA;150;60;2;0;15\n", None),
+    ("Komma-CSV mit Dezimalpunkt", "A,1200.5,50\n", (1200.5, 50.0)),
+)
+
+
+def pruefe_zahlenformat():
+    fehler = []
+    for text, daten, erwartet in PRUEF_KATALOG_CSV:
+        gelesen = [(g["kw_max"], g["kw_min"], g["preis"]) for g in kaskade.katalog_aus_csv(daten)]
+        if gelesen != ([erwartet] if erwartet else []):
+            fehler.append(f"Katalog-CSV ({text}): {gelesen}, erwartet {erwartet}")
+    for text, daten, erwartet in PRUEF_PORTFOLIO_CSV:
+        statistik = {}
+        gelesen = [(g["flaeche"], g["wm2"]) for g in export.portfolio_aus_csv(daten, statistik)]
+        if gelesen != ([erwartet] if erwartet else []) or statistik["uebersprungen"] != (0 if erwartet else 1):
+            fehler.append(f"Portfolio-CSV ({text}): {gelesen}, {statistik}, erwartet {erwartet}")
+    return len(PRUEF_KATALOG_CSV) + len(PRUEF_PORTFOLIO_CSV), fehler
+
+
+def pruefen():
+    gesamt = 0
+    alle_fehler = []
+    for name, pruefung in (("Kaskade vs. Brute Force", pruefe_kaskade), ("Zahlenformat CSV", pruefe_zahlenformat)):
+        start = time.perf_counter()
+        faelle, fehler = pruefung()
+        gesamt += faelle
+        alle_fehler += fehler
+        print(f"{name:<28} {faelle:>4} Fälle  {len(fehler):>3} Fehler  ({time.perf_counter() - start:.1f} s)")
+    for f in alle_fehler:
+        print(f"  FEHLER: {f}")
+    if not alle_fehler:
+        print(f"Alle {gesamt} Prüfungen bestanden.")
+    return 1 if alle_fehler else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks für central STATION")
+    parser.add_argument("--only", default="", help="Kommagetrennte Auswahl: " + ",".join(BENCHMARKS))
+    parser.add_argument("--scales", default=",".join(str(n) for n in SKALEN), help="Gebäude-Anzahlen, z.B. 1,100,10000")
+    parser.add_argument("--repeat", type=int, default=5, help="Wiederholungen pro Messung (Median)")
+    parser.add_argument("--threshold", type=float, default=float(os.environ.get("CS_BENCH_THRESHOLD", "20")),
+                        help="Erlaubte Verschlechterung in Prozent")
+    parser.add_argument("--baseline", default=BASELINE_DATEI)
+    parser.add_argument("--output", default=ERGEBNIS_DATEI)
+    parser.add_argument("--save-baseline", action="store_true")
+    parser.add_argument("--full", action="store_true", help="Schwere Benchmarks (Kaskade/Plotly/Charts/PDF) ohne Begrenzung der Batch-Größe")
+    parser.add_argument("--pruefen", action="store_true", help="Nur Korrektheit prüfen (Kaskade gegen Brute Force, CSV-Zahlenformat)")
+    args = parser.parse_args(argv)
+
+    if args.pruefen:
+        return pruefen()
+
+    namen = [n.strip() for n in args.only.split(",") if n.strip()] or list(BENCHMARKS)
+    unbekannt = [n for n in namen if n not in BENCHMARKS]
+    if unbekannt:
+        parser.error(f"Unbekannte Benchmarks: {', '.join(unbekannt)}")
+    skalen = [int(n) for n in args.scales.split(",") if n.strip()]
+
+    ergebnisse = alle_messen(namen, skalen, args.repeat, args.full)
+    speichern(args.output, ergebnisse)
+    print(f"\nErgebnisse gespeichert: {args.output}")
+
+    if args.save_baseline:
+        speichern(args.baseline, ergebnisse)
+        print(f"Baseline gespeichert: {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"Keine Baseline ({args.baseline}) vorhanden -> kein Vergleich. Mit --save-baseline anlegen.")
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f)["ergebnisse"]
+    regressionen = vergleichen(ergebnisse, baseline, args.threshold)
+    if not regressionen:
+        print(f"Keine Regression über {args.threshold:.0f} % gegenüber der Baseline.")
+        return 0
+
+    print(f"\nREGRESSIONEN (> {args.threshold:.0f} %):")
+    for schluessel, alt, neu, prozent in regressionen:
+        print(f"  {schluessel:<28} {alt * 1000:10.2f} ms -> {neu * 1000:10.2f} ms  (+{prozent:.1f} %)")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
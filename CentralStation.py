@@ -1,12 +1,21 @@
 # ----------------------------------------------------------------------------
 # DATEI: CentralStation.py
-# STAND: 10.02.2026 - 09:05 Uhr
+# STAND: 20.10.2026 - 09:30 Uhr
 # BESCHREIBUNG: Haupt-Cockpit (Fix: Alle CSS-Klammern verdoppelt!)
+# ÄNDERUNGEN:
+# 1. Laufzeit-Messung der Rerun-Phasen + Debug-Panel (opt-in, siehe Laufzeit_Monitor.py)
+# 2. Profiler pro Rerun (opt-in über CS_PROFILE / ?profile=, siehe Rerun_Profiler.py)
+# 3. Logo in Anzeigegröße aus assets_cache (WP_Assets.py) statt 4009-px-Original
+# 4. Gesamtzeit + Metrik-Export über monitor.rerun_messung() (gleich wie in den Fragmenten der Module)
 # ----------------------------------------------------------------------------
 import streamlit as st
 import os
 import base64
 import importlib
+import Laufzeit_Monitor as monitor
+from Laufzeit_Monitor import messung
+from Rerun_Profiler import profiliere_rerun
+from WP_Assets import asset
 
 # ============================================================
 # SEITE KONFIGURIEREN (Muss zwingend als erstes stehen)
@@ -20,75 +29,78 @@ def get_font_as_base64(font_path):
     return None
 
 def main():
+    metrics_aktiv = monitor.ist_aktiv()
+
     # --- DESIGN VARIABLEN ---
     BG_COLOR = "#36A9E1"            # Hellblau (Hintergrund & Akzente)
     TEXT_GRAY = "#3C3C3B"           # Grau (Standard Text)
     FONT_FILE = "POE Vetica UI.ttf"
 
     # --- CSS SCHUTZ (Wird IMMER geladen) ---
-    font_base64 = get_font_as_base64(FONT_FILE)
-    if font_base64:
-        # WICHTIG: Alle CSS-Klammern muessen hier doppelt sein {{ }}
-        st.markdown(f"""
-        <style>
-        @font-face {{
-            font-family: 'POE Helvetica UI';
-            src: url(data:font/ttf;base64,{font_base64}) format('truetype');
-        }}
+    with messung("central.css"):
+        font_base64 = get_font_as_base64(FONT_FILE)
+        if font_base64:
+            # WICHTIG: Alle CSS-Klammern muessen hier doppelt sein {{ }}
+            st.markdown(f"""
+            <style>
+            @font-face {{
+                font-family: 'POE Helvetica UI';
+                src: url(data:font/ttf;base64,{font_base64}) format('truetype');
+            }}
         
-        /* Globaler Font-Fix */
-        html, body, [data-testid="stAppViewContainer"], * {{
-            font-family: 'POE Helvetica UI', sans-serif !important;
-        }}
+            /* Globaler Font-Fix */
+            html, body, [data-testid="stAppViewContainer"], * {{
+                font-family: 'POE Helvetica UI', sans-serif !important;
+            }}
         
-        /* Hintergrund */
-        .stApp {{ background-color: {BG_COLOR}; }}
+            /* Hintergrund */
+            .stApp {{ background-color: {BG_COLOR}; }}
         
-        /* Header Klassen */
-        .cs-welcome {{ 
-            font-size: 34px !important; 
-            text-align: center; 
-            color: {TEXT_GRAY} !important; 
-            margin-top: -50px !important; 
-        }}
-        .cs-title-line {{ 
-            font-size: 52px !important; 
-            font-weight: bold !important; 
-            text-align: center; 
-            margin-top: -35px !important; 
-            line-height: 1.0 !important; 
-        }}
-        .white-part {{ color: white !important; }}
-        .gray-part {{ color: {TEXT_GRAY} !important; }}
+            /* Header Klassen */
+            .cs-welcome {{ 
+                font-size: 34px !important; 
+                text-align: center; 
+                color: {TEXT_GRAY} !important; 
+                margin-top: -50px !important; 
+            }}
+            .cs-title-line {{ 
+                font-size: 52px !important; 
+                font-weight: bold !important; 
+                text-align: center; 
+                margin-top: -35px !important; 
+                line-height: 1.0 !important; 
+            }}
+            .white-part {{ color: white !important; }}
+            .gray-part {{ color: {TEXT_GRAY} !important; }}
         
-        /* HR Linie */
-        hr {{ 
-            border: 1px solid {TEXT_GRAY} !important; 
-            opacity: 0.3 !important; 
-            margin: 15px 0 !important; 
-        }}
-
-        /* --- STYLING FÜR DAS AUSWAHLFELD (MODUSFELD) --- */
-        div[data-baseweb="select"] {{ 
-            background-color: white !important; 
-            border-radius: 12px !important; 
-            border: 2px solid {TEXT_GRAY} !important; 
-        }}
+            /* HR Linie */
+            hr {{ 
+                border: 1px solid {TEXT_GRAY} !important; 
+                opacity: 0.3 !important; 
+                margin: 15px 0 !important; 
+            }}
+
+            /* --- STYLING FÜR DAS AUSWAHLFELD (MODUSFELD) --- */
+            div[data-baseweb="select"] {{ 
+                background-color: white !important; 
+                border-radius: 12px !important; 
+                border: 2px solid {TEXT_GRAY} !important; 
+            }}
         
-        /* Text im Auswahlfeld: HELLBLAU */
-        div[data-baseweb="select"] div {{
-            color: {BG_COLOR} !important;
-            font-weight: bold !important;
-        }}
+            /* Text im Auswahlfeld: HELLBLAU */
+            div[data-baseweb="select"] div {{
+                color: {BG_COLOR} !important;
+                font-weight: bold !important;
+            }}
         
-        /* Icon (Pfeil) im Auswahlfeld: HELLBLAU */
-        div[data-baseweb="select"] svg {{
-            fill: {BG_COLOR} !important;
-        }}
-        </style>
-        """, unsafe_allow_html=True)
-    else:
-        st.error(f"Schriftdatei '{FONT_FILE}' nicht gefunden!")
+            /* Icon (Pfeil) im Auswahlfeld: HELLBLAU */
+            div[data-baseweb="select"] svg {{
+                fill: {BG_COLOR} !important;
+            }}
+            </style>
+            """, unsafe_allow_html=True)
+        else:
+            st.error(f"Schriftdatei '{FONT_FILE}' nicht gefunden!")
 
     # ============================================================
     # HEADER - DIESER TEIL BLEIBT IMMER SICHTBAR
@@ -97,9 +109,9 @@ def main():
 
     _, col_m, _ = st.columns([1, 1.2, 1]) 
     with col_m:
-        logo_path = "Coolsulting_Logo_ohneHG_outlines_weiß.png"
+        logo_path = asset("Coolsulting_Logo_ohneHG_outlines_weiß.png")
         if os.path.exists(logo_path):
-            st.image(logo_path, use_container_width=True)
+            st.image(logo_path, width="stretch")
     
     st.markdown(f"""
         <div class="cs-title-line">
@@ -125,9 +137,11 @@ def main():
 
     elif tool_wahl == "Heizlastberechnung für Wärmepumpen (WP Modul 1)":
         try:
-            import Waermepumpen_Auslegung as wp_modul
-            importlib.reload(wp_modul)
-            wp_modul.main() 
+            with messung("central.reload"):
+                import Waermepumpen_Auslegung as wp_modul
+                importlib.reload(wp_modul)
+            with messung("modul1.main"):
+                wp_modul.main() 
         except ImportError:
             try:
                 # Fallback Kleinschreibung
@@ -141,11 +155,21 @@ def main():
 
     elif tool_wahl == "WP Quick-Kalkulator (Quickie)":
         try:
-            import WP_Quick_Kalkulator as quickie
-            importlib.reload(quickie)
-            quickie.main()
+            with messung("central.reload"):
+                import WP_Quick_Kalkulator as quickie
+                importlib.reload(quickie)
+            with messung("quickie.main"):
+                quickie.main()
         except Exception as e:
             st.error(f"Fehler beim Laden des Quickies: {e}")
 
+    # ============================================================
+    # DEBUG: LAUFZEITEN (nur mit CS_METRICS=1 oder ?metrics=1)
+    # ============================================================
+    # central.rerun + Export erfasst rerun_messung() nach main(); das Panel zeigt den Stand davor
+    if metrics_aktiv:
+        monitor.zeige_debug_panel()
+
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    with profiliere_rerun(), monitor.rerun_messung("central.rerun"):
+        main()
\ No newline at end of file
@@ -0,0 +1,198 @@
+# ==========================================
+# DATEI: Lasttest.py
+# ZEITSTEMPEL: 20.10.2026 - 09:40 Uhr
+#
+# BESCHREIBUNG:
+# Lasttest für die central STATION ohne Browser: Streamlit AppTest simuliert
+# N gleichzeitige Sitzungen (je ein Thread, wie im echten Server-Prozess).
+# Jede Sitzung wechselt zwischen den Tools im Auswahlfeld, bewegt Slider und
+# drückt "AUSLEGUNG BERECHNEN" bzw. "BERECHNUNG STARTEN".
+#
+# Ausgabe pro Sitzungsanzahl: Rerun-Latenz (p50/p90/p95/p99), CPU-Auslastung
+# und RSS-Zuwachs des Prozesses -> Grundlage für Autoscaling-Schwellen.
+# Vorab läuft eine ungemessene Aufwärm-Sitzung: die einmaligen Importe (streamlit,
+# plotly, matplotlib, fpdf, Module) zählen sonst als RSS-Zuwachs der ersten Stufe.
+#
+# GRENZE: AppTest rerunnt bei Widgets innerhalb von st.fragment das GANZE Skript
+# (central.rerun zählt jede Interaktion). Im Server rerunnen Slider in Modul 1 und
+# im Quickie nur das Fragment -> die Latenzen hier sind eine Obergrenze.
+#
+# AUFRUF:
+#   python Lasttest.py                              -> 1,2,4,8 Sitzungen, je 3 Durchläufe
+#   python Lasttest.py --sessions 1,5,10 --rounds 5
+#   python Lasttest.py --output lasttest.json
+# ==========================================
+
+import argparse
+import json
+import os
+import resource
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from streamlit.testing.v1 import AppTest
+
+APP_DATEI = os.path.join(os.path.dirname(os.path.abspath(__file__)), "CentralStation.py")
+
+TOOL_MODUL1 = "Heizlastberechnung für Wärmepumpen (WP Modul 1)"
+TOOL_QUICKIE = "WP Quick-Kalkulator (Quickie)"
+
+# Slider-Werte, die pro Durchlauf reihum gesetzt werden
+M1_SLIDER = {
+    "m1_normtemp": (-16, -12, -10),
+    "m1_vl": (45, 55, 65),
+    "m1_sperr": (2, 4, 6),
+    "m1_biv_mono": (-15, -10, -5),
+}
+
+
+# ==========================================
+# 1. PROZESS-MESSWERTE (ohne psutil)
+# ==========================================
+def rss_mb():
+    """Aktueller Resident Set Size in MB (Linux /proc, sonst Peak laut getrusage)"""
+    try:
+        with open("/proc/self/status", encoding="ascii") as f:
+            for zeile in f:
+                if zeile.startswith("VmRSS:"):
+                    return int(zeile.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def perzentil(werte, p):
+    if not werte:
+        return 0.0
+    werte = sorted(werte)
+    k = (len(werte) - 1) * p / 100
+    unten = int(k)
+    oben = min(unten + 1, len(werte) - 1)
+    return werte[unten] + (werte[oben] - werte[unten]) * (k - unten)
+
+
+# ==========================================
+# 2. EINE SIMULIERTE SITZUNG
+# ==========================================
+def _button(at, label):
+    for b in at.button:
+        if b.label == label:
+            return b
+    raise LookupError(f"Button '{label}' nicht gefunden")
+
+
+def sitzung(nr, durchlaeufe, timeout):
+    """Führt die Interaktionen einer Sitzung aus und liefert die Rerun-Latenzen in Sekunden"""
+    latenzen = []
+    fehler = []
+    schritt = {"runde": "-", "name": "Start"}
+
+    def rerun(element, name):
+        schritt["name"] = name
+        start = time.perf_counter()
+        element.run(timeout=timeout)
+        latenzen.append(time.perf_counter() - start)
+        # Sofort prüfen: der nächste volle Rerun (z.B. Tool-Wechsel) setzt at.exception zurück
+        for ausnahme in at.exception:
+            fehler.append(f"Sitzung {nr}, Runde {schritt['runde']}, {name}: {ausnahme.message}")
+
+    at = AppTest.from_file(APP_DATEI, default_timeout=timeout)
+    rerun(at, "Start")
+
+    for runde in range(durchlaeufe):
+        schritt["runde"] = runde
+        i = (nr + runde) % 3
+        try:
+            # Modul 1: Tool wählen, Slider bewegen, berechnen
+            rerun(at.selectbox[0].select(TOOL_MODUL1), "Modul 1 wählen")
+            for key, werte in M1_SLIDER.items():
+                rerun(at.slider(key=key).set_value(werte[i]), f"Slider {key}")
+            rerun(_button(at, "AUSLEGUNG BERECHNEN").click(), "AUSLEGUNG BERECHNEN")
+
+            # Quickie: Gas und Öl berechnen
+            rerun(at.selectbox[0].select(TOOL_QUICKIE), "Quickie wählen")
+            rerun(at.slider(key="qk_g_w").set_value(80 + 5 * i), "Slider qk_g_w")
+            rerun(_button(at, "BERECHNUNG STARTEN (GAS)").click(), "BERECHNUNG STARTEN (GAS)")
+            rerun(_button(at, "BERECHNUNG STARTEN (ÖL)").click(), "BERECHNUNG STARTEN (ÖL)")
+
+            # Zurück zur Übersicht
+            rerun(at.selectbox[0].select("Übersicht"), "Übersicht wählen")
+        except Exception as e:
+            fehler.append(f"Sitzung {nr}, Runde {runde}, {schritt['name']}: {e}")
+    return latenzen, fehler
+
+
+# ==========================================
+# 3. LASTSTUFEN
+# ==========================================
+def laststufe(anzahl, durchlaeufe, timeout):
+    rss_vorher = rss_mb()
+    cpu_vorher = time.process_time()
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=anzahl, thread_name_prefix="sitzung") as pool:
+        ergebnisse = list(pool.map(lambda nr: sitzung(nr, durchlaeufe, timeout), range(anzahl)))
+
+    dauer = time.perf_counter() - start
+    cpu = time.process_time() - cpu_vorher
+    latenzen = [l for lat, _ in ergebnisse for l in lat]
+    fehler = [f for _, fe in ergebnisse for f in fe]
+    rss_nachher = rss_mb()
+
+    return {
+        "sitzungen": anzahl,
+        "reruns": len(latenzen),
+        "dauer_s": round(dauer, 3),
+        "reruns_pro_s": round(len(latenzen) / dauer, 2) if dauer else 0.0,
+        "p50_ms": round(perzentil(latenzen, 50) * 1000, 1),
+        "p90_ms": round(perzentil(latenzen, 90) * 1000, 1),
+        "p95_ms": round(perzentil(latenzen, 95) * 1000, 1),
+        "p99_ms": round(perzentil(latenzen, 99) * 1000, 1),
+        "mittel_ms": round(statistics.mean(latenzen) * 1000, 1) if latenzen else 0.0,
+        # CPU-Sekunden pro Wand-Sekunde (1.0 = ein Kern voll ausgelastet)
+        "cpu_kerne": round(cpu / dauer, 2) if dauer else 0.0,
+        "rss_vorher_mb": round(rss_vorher, 1),
+        "rss_nachher_mb": round(rss_nachher, 1),
+        "rss_zuwachs_pro_sitzung_mb": round((rss_nachher - rss_vorher) / anzahl, 2),
+        "fehler": fehler,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Lasttest für central STATION (Streamlit AppTest)")
+    parser.add_argument("--sessions", default="1,2,4,8", help="Gleichzeitige Sitzungen je Stufe, z.B. 1,2,4,8")
+    parser.add_argument("--rounds", type=int, default=3, help="Durchläufe (Tool-Wechsel + Berechnungen) pro Sitzung")
+    parser.add_argument("--timeout", type=float, default=120, help="Timeout pro Rerun in Sekunden")
+    parser.add_argument("--output", default="", help="Ergebnisse zusätzlich als JSON speichern")
+    args = parser.parse_args(argv)
+
+    stufen = [int(n) for n in args.sessions.split(",") if n.strip()]
+    print(f"{'Sitz.':>5} {'Reruns':>7} {'p50':>8} {'p90':>8} {'p95':>8} {'p99':>8} {'CPU':>6} {'RSS MB':>8} {'+MB/Sitz.':>10}")
+
+    # Aufwärmen (ungemessen): Importe und Caches, sonst Teil des RSS-Zuwachses der ersten Stufe
+    _, fehler_aufwaermen = sitzung(0, 1, args.timeout)
+    for f in fehler_aufwaermen[:5]:
+        print(f"      FEHLER (Aufwärmen): {f}")
+
+    ergebnisse = []
+    for anzahl in stufen:
+        e = laststufe(anzahl, args.rounds, args.timeout)
+        ergebnisse.append(e)
+        print(f"{e['sitzungen']:>5} {e['reruns']:>7} {e['p50_ms']:>8.1f} {e['p90_ms']:>8.1f} {e['p95_ms']:>8.1f} "
+              f"{e['p99_ms']:>8.1f} {e['cpu_kerne']:>6.2f} {e['rss_nachher_mb']:>8.1f} {e['rss_zuwachs_pro_sitzung_mb']:>10.2f}")
+        for f in e["fehler"][:5]:
+            print(f"      FEHLER: {f}")
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump({"durchlaeufe": args.rounds, "fehler_aufwaermen": fehler_aufwaermen, "stufen": ergebnisse},
+                      f, indent=2, ensure_ascii=False)
+        print(f"\nErgebnisse gespeichert: {args.output}")
+
+    return 1 if fehler_aufwaermen or any(e["fehler"] for e in ergebnisse) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,232 @@
+# ==========================================
+# DATEI: Laufzeit_Monitor.py
+# ZEITSTEMPEL: 20.10.2026 - 09:30 Uhr
+#
+# BESCHREIBUNG:
+# Leichtgewichtige Zeitmessung für die Phasen eines Reruns (CSS, Modul-Reload,
+# Widgets, Plotly, PDF). Die Messwerte landen in Histogrammen pro Prozess,
+# werden im Debug-Panel angezeigt und als Prometheus-Textdatei exportiert.
+#
+# AKTIVIERUNG (opt-in):
+# - Umgebungsvariable CS_METRICS=1 (für alle Sitzungen)
+# - Query-Parameter ?metrics=1 (nur für diese Sitzung)
+# - CS_METRICS_FILE=<pfad> schreibt die Textdatei nach jedem Rerun
+#   (auch nach Fragment-Reruns, die CentralStation.main() nicht durchlaufen)
+# Ohne Aktivierung liefert messung() nur einen leeren Kontext-Manager.
+# ==========================================
+
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+import streamlit as st
+
+# Bucket-Grenzen in Sekunden (wie bei Prometheus üblich, kumulativ ausgegeben)
+BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+METRIK_NAME = "centralstation_stage_seconds"
+
+_LEER = nullcontext()
+_lokal = threading.local()
+_sperre = threading.Lock()
+_histogramme = {}
+
+
+class Histogramm:
+    def __init__(self):
+        self.zaehler = [0] * (len(BUCKETS) + 1)  # letzter Eintrag = +Inf
+        self.summe = 0.0
+        self.anzahl = 0
+
+    def erfassen(self, dauer):
+        i = 0
+        while i < len(BUCKETS) and dauer > BUCKETS[i]:
+            i += 1
+        self.zaehler[i] += 1
+        self.summe += dauer
+        self.anzahl += 1
+
+    def quantil(self, q):
+        """Schätzt ein Quantil per linearer Interpolation innerhalb des Buckets"""
+        if self.anzahl == 0:
+            return 0.0
+        ziel = q * self.anzahl
+        kumuliert = 0
+        untergrenze = 0.0
+        for i, n in enumerate(self.zaehler):
+            obergrenze = BUCKETS[i] if i < len(BUCKETS) else BUCKETS[-1]
+            if n and kumuliert + n >= ziel:
+                return untergrenze + (obergrenze - untergrenze) * (ziel - kumuliert) / n
+            kumuliert += n
+            untergrenze = obergrenze
+        return BUCKETS[-1]
+
+
+class _Messung:
+    __slots__ = ("phase", "start")
+
+    def __init__(self, phase):
+        self.phase = phase
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        erfassen(self.phase, time.perf_counter() - self.start)
+        return False
+
+
+def _query_aktiv():
+    try:
+        return st.query_params.get("metrics") == "1"
+    except Exception:
+        return False
+
+
+def starte_rerun():
+    """Legt zu Beginn eines Reruns fest, ob in diesem Thread gemessen wird"""
+    _lokal.aktiv = os.environ.get("CS_METRICS") == "1" or _query_aktiv()
+    return _lokal.aktiv
+
+
+def ist_aktiv():
+    aktiv = getattr(_lokal, "aktiv", None)
+    if aktiv is None:
+        # z.B. Fragment-Rerun in einem neuen Thread ohne starte_rerun()
+        aktiv = starte_rerun()
+    return aktiv
+
+
+def messung(phase):
+    """Kontext-Manager für eine Zeitspanne. Deaktiviert praktisch kostenlos."""
+    if not ist_aktiv():
+        return _LEER
+    return _Messung(phase)
+
+
+def erfassen_seit(phase, start):
+    """Für längere Abschnitte ohne Einrückung: start = time.perf_counter()"""
+    if ist_aktiv():
+        erfassen(phase, time.perf_counter() - start)
+
+
+def erfassen(phase, dauer):
+    with _sperre:
+        hist = _histogramme.get(phase)
+        if hist is None:
+            hist = _histogramme[phase] = Histogramm()
+        hist.erfassen(dauer)
+
+
+@contextmanager
+def rerun_messung(phase):
+    """Umschließt einen ganzen Rerun (central.rerun) bzw. einen Fragment-Rerun (*.fragment):
+    Gesamtzeit erfassen, danach CS_METRICS_FILE neu schreiben. Ein Fragment innerhalb eines
+    vollen Reruns wird nur gemessen, Export macht der äußere Rerun."""
+    if getattr(_lokal, "rerun_laeuft", False):
+        with messung(phase):
+            yield ist_aktiv()
+        return
+    aktiv = starte_rerun()
+    _lokal.rerun_laeuft = True
+    start = time.perf_counter()
+    try:
+        yield aktiv
+    finally:
+        _lokal.rerun_laeuft = False
+        if aktiv:
+            erfassen(phase, time.perf_counter() - start)
+            if os.environ.get("CS_METRICS_FILE"):
+                try:
+                    export_datei()
+                except OSError:
+                    pass  # Metrik-Export darf den Rerun nie abbrechen
+
+
+def zuruecksetzen():
+    with _sperre:
+        _histogramme.clear()
+
+
+def zusammenfassung():
+    """Liefert pro Phase Anzahl, Mittelwert und geschätzte Quantile in ms"""
+    with _sperre:
+        zeilen = []
+        for phase in sorted(_histogramme):
+            h = _histogramme[phase]
+            zeilen.append({
+                "Phase": phase,
+                "Anzahl": h.anzahl,
+                "Mittel (ms)": round(h.summe / h.anzahl * 1000, 2) if h.anzahl else 0.0,
+                "p50 (ms)": round(h.quantil(0.50) * 1000, 2),
+                "p95 (ms)": round(h.quantil(0.95) * 1000, 2),
+                "Summe (s)": round(h.summe, 3),
+            })
+        return zeilen
+
+
+def prometheus_text():
+    """Erzeugt das Prometheus-Textformat (Histogramm mit Label 'stage')"""
+    pid = os.getpid()
+    zeilen = [
+        f"# HELP {METRIK_NAME} Laufzeit der Rerun-Phasen der central STATION",
+        f"# TYPE {METRIK_NAME} histogram",
+    ]
+    with _sperre:
+        for phase in sorted(_histogramme):
+            h = _histogramme[phase]
+            labels = f'stage="{phase}",pid="{pid}"'
+            kumuliert = 0
+            for grenze, n in zip(BUCKETS, h.zaehler):
+                kumuliert += n
+                zeilen.append(f'{METRIK_NAME}_bucket{{{labels},le="{grenze}"}} {kumuliert}')
+            zeilen.append(f'{METRIK_NAME}_bucket{{{labels},le="+Inf"}} {h.anzahl}')
+            zeilen.append(f"{METRIK_NAME}_sum{{{labels}}} {h.summe:.6f}")
+            zeilen.append(f"{METRIK_NAME}_count{{{labels}}} {h.anzahl}")
+    return "\n".join(zeilen) + "\n"
+
+
+def export_datei(pfad=None):
+    """Schreibt die Metriken atomar (tmp + rename), damit der Scraper nie halbe Dateien liest"""
+    if pfad is None:
+        pfad = os.environ.get("CS_METRICS_FILE") or os.path.join("metrics", f"centralstation_{os.getpid()}.prom")
+    ordner = os.path.dirname(pfad)
+    if ordner:
+        os.makedirs(ordner, exist_ok=True)
+    # Eigene tmp-Datei pro Aufruf: alle Sitzungen sind Threads im selben Prozess
+    fd, tmp = tempfile.mkstemp(dir=ordner or ".", prefix=f".{os.path.basename(pfad)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(prometheus_text())
+        os.replace(tmp, pfad)
+    except OSError:
+        try: os.remove(tmp)
+        except OSError: pass
+        raise
+    return pfad
+
+
+def zeige_debug_panel():
+    """Debug-Panel mit den Histogramm-Werten dieses Prozesses"""
+    if not ist_aktiv():
+        return
+    with st.expander("🛠️ Debug: Rerun-Laufzeiten", expanded=False):
+        daten = zusammenfassung()
+        if daten:
+            st.dataframe(daten, hide_index=True, width="stretch")
+        else:
+            st.markdown("Noch keine Messwerte vorhanden.")
+
+        c1, c2, c3 = st.columns(3)
+        with c1:
+            if st.button("Metrik-Datei schreiben", key="cs_metrics_export"):
+                st.success(f"Geschrieben: {export_datei()}")
+        with c2:
+            st.download_button("Prometheus-Text herunterladen", data=prometheus_text(),
+                               file_name="centralstation.prom", mime="text/plain", key="cs_metrics_download")
+        with c3:
+            if st.button("Messwerte zurücksetzen", key="cs_metrics_reset"):
+                zuruecksetzen()
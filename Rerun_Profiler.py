@@ -0,0 +1,177 @@
+# ==========================================
+# DATEI: Rerun_Profiler.py
+# ZEITSTEMPEL: 20.10.2026 - 09:50 Uhr
+#
+# BESCHREIBUNG:
+# Opt-in Profiler für genau einen Rerun der central STATION (inkl. dem
+# aufgerufenen wp_modul.main() / quickie.main()). Fragmente (st.fragment) rerunnen
+# ohne die central STATION und umschließen sich deshalb selbst; läuft das Fragment
+# innerhalb eines vollen Reruns, profiliert nur der äußere. Pro Rerun wird eine Datei in
+# einen rotierenden lokalen Ordner geschrieben, aus der offline Flamegraphs
+# erzeugt werden können.
+#
+# AKTIVIERUNG:
+# - CS_PROFILE=cprofile  bzw. ?profile=cprofile  -> .prof (pstats, z.B. snakeviz / flameprof)
+# - CS_PROFILE=sampling  bzw. ?profile=sampling  -> .folded (Collapsed Stacks, z.B. flamegraph.pl / speedscope)
+# - CS_PROFILE=1 bzw. ?profile=1 entspricht "cprofile"
+#
+# GRENZEN DES ORDNERS (ältere Dateien werden gelöscht):
+# - CS_PROFILE_DIR        (Standard: profiles)
+# - CS_PROFILE_MAX_FILES  (Standard: 50)
+# - CS_PROFILE_MAX_MB     (Standard: 100)
+# - CS_PROFILE_INTERVAL_MS Abtastintervall im Sampling-Modus (Standard: 5)
+# Ist der Ordner nicht beschreibbar oder ein Wert ungültig, läuft der Rerun ohne Profil.
+# ==========================================
+
+import cProfile
+import os
+import sys
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime
+
+import streamlit as st
+
+MODI = {"1": "cprofile", "cprofile": "cprofile", "sampling": "sampling"}
+
+_zaehler = 0
+_zaehler_sperre = threading.Lock()
+_laufend = threading.local()  # je Rerun-Thread: läuft bereits eine Messung?
+
+
+def gewaehlter_modus():
+    """Liefert 'cprofile', 'sampling' oder None (Profiler aus)"""
+    wert = os.environ.get("CS_PROFILE", "")
+    if not wert:
+        try:
+            wert = st.query_params.get("profile", "")
+        except Exception:
+            wert = ""
+    return MODI.get(wert.lower())
+
+
+class _Sampler(threading.Thread):
+    """Tastet den Stack des Rerun-Threads periodisch ab (Collapsed-Stack-Format)"""
+
+    def __init__(self, thread_id, intervall):
+        super().__init__(name="cs-profiler-sampler", daemon=True)
+        self.thread_id = thread_id
+        self.intervall = intervall
+        self.stapel = Counter()
+        self._ende = threading.Event()
+
+    def run(self):
+        while not self._ende.wait(self.intervall):
+            frame = sys._current_frames().get(self.thread_id)
+            teile = []
+            while frame is not None:
+                code = frame.f_code
+                teile.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if teile:
+                self.stapel[";".join(reversed(teile))] += 1
+
+    def stoppen(self):
+        self._ende.set()
+        self.join()
+
+    def als_text(self):
+        return "".join(f"{stack} {anzahl}\n" for stack, anzahl in self.stapel.most_common())
+
+
+def _dateiname(ordner, endung):
+    global _zaehler
+    with _zaehler_sperre:
+        _zaehler += 1
+        nr = _zaehler
+    stempel = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+    return os.path.join(ordner, f"rerun_{stempel}_{os.getpid()}_{nr:05d}.{endung}")
+
+
+def aufraeumen(ordner, max_dateien, max_bytes):
+    """Löscht die ältesten Profil-Dateien, bis Anzahl und Gesamtgröße passen"""
+    dateien = []
+    for name in os.listdir(ordner):
+        if name.endswith((".prof", ".folded")):
+            pfad = os.path.join(ordner, name)
+            try:
+                info = os.stat(pfad)
+            except OSError:
+                continue
+            dateien.append((info.st_mtime, info.st_size, pfad))
+    dateien.sort()
+    gesamt = sum(d[1] for d in dateien)
+    while dateien and (len(dateien) > max_dateien or gesamt > max_bytes):
+        _, groesse, pfad = dateien.pop(0)
+        try:
+            os.remove(pfad)
+        except OSError:
+            pass
+        gesamt -= groesse
+
+
+@contextmanager
+def profiliere_rerun():
+    """Umschließt einen Rerun. Ohne Aktivierung oder innerhalb einer laufenden Messung passiert nichts."""
+    modus = gewaehlter_modus()
+    if modus is None or getattr(_laufend, "aktiv", False):
+        yield None
+        return
+    _laufend.aktiv = True
+    try:
+        with _profiliere(modus) as ergebnis:
+            yield ergebnis
+    finally:
+        _laufend.aktiv = False
+
+
+def _ablegen(ordner, endung, schreiben, max_dateien, max_bytes):
+    """Profil-Datei schreiben + aufräumen. Volle Platte oder fehlende Rechte brechen den Rerun nie ab."""
+    try:
+        schreiben(_dateiname(ordner, endung))
+        aufraeumen(ordner, max_dateien, max_bytes)
+    except OSError:
+        pass
+
+
+@contextmanager
+def _profiliere(modus):
+    """cProfile bzw. Sampler für einen Rerun, Datei in CS_PROFILE_DIR"""
+    try:
+        ordner = os.environ.get("CS_PROFILE_DIR", "profiles")
+        max_dateien = int(os.environ.get("CS_PROFILE_MAX_FILES", "50"))
+        max_bytes = float(os.environ.get("CS_PROFILE_MAX_MB", "100")) * 1024 * 1024
+        intervall = float(os.environ.get("CS_PROFILE_INTERVAL_MS", "5")) / 1000
+        os.makedirs(ordner, exist_ok=True)
+    except (OSError, ValueError):
+        # Ungültige Grenzwerte oder Ordner nicht anlegbar -> Rerun ohne Profiler
+        yield None
+        return
+
+    if modus == "sampling":
+        sampler = _Sampler(threading.get_ident(), intervall)
+        sampler.start()
+        try:
+            yield modus
+        finally:
+            sampler.stoppen()
+
+            def schreiben(pfad):
+                with open(pfad, "w", encoding="utf-8") as f:
+                    f.write(sampler.als_text())
+            _ablegen(ordner, "folded", schreiben, max_dateien, max_bytes)
+        return
+
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Ein anderer Profiler ist bereits aktiv -> Rerun normal ausführen
+        yield None
+        return
+    try:
+        yield modus
+    finally:
+        profiler.disable()
+        _ablegen(ordner, "prof", profiler.dump_stats, max_dateien, max_bytes)
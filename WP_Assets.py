@@ -0,0 +1,175 @@
+# ==========================================
+# DATEI: WP_Assets.py
+# ZEITSTEMPEL: 19.10.2026 - 22:00 Uhr
+#
+# BESCHREIBUNG:
+# Logo-Varianten in passender Größe statt der Original-PNGs (4009 x 1605 px):
+# - "web": 800 px breit (Header-Spalte ~400 px bei 2x-Displays). Streamlit reicht
+#   PNGs bis 1460 px unverändert durch; größere Bilder werden bei JEDEM Rerun
+#   dekodiert, skaliert und neu als PNG kodiert. WebP bringt bei st.image nichts,
+#   Streamlit kodiert Bilder mit Alphakanal ohnehin nach PNG um.
+# - "pdf": 1181 px = 100 mm Druckbreite im PDF-Header bei 300 dpi.
+# Reine Graustufen-Logos (z.B. weiß + Transparenz) werden verlustfrei als LA
+# gespeichert, alle Varianten mit optimize=True.
+#
+# Die Varianten werden einmal erzeugt und unter dem Hash der Quelle abgelegt
+# (assets_cache/<name>_<hash>_<variante>.png). Ändert sich das Original, entsteht
+# automatisch eine neue Variante, die alte wird gelöscht.
+#
+# AUFRUF (Build-Schritt, optional - zur Laufzeit wird bei Bedarf erzeugt):
+#   python WP_Assets.py               -> alle Logos, Größen vorher/nachher
+#   python WP_Assets.py --bericht     -> zusätzlich PDF-Header-Größe vorher/nachher
+#
+# UMGEBUNG:
+#   CS_ASSET_DIR   Ablage der Varianten (Standard: assets_cache)
+# ==========================================
+
+import argparse
+import glob
+import hashlib
+import io
+import os
+import re
+import sys
+import tempfile
+from functools import lru_cache
+
+from PIL import Image
+
+VARIANTEN = {
+    "web": 800,
+    "pdf": 1181,
+}
+
+LOGO_MUSTER = "Coolsulting_Logo_ohneHG_*.png"
+
+
+def asset_ordner():
+    return os.environ.get("CS_ASSET_DIR", "assets_cache")
+
+
+@lru_cache(maxsize=64)
+def _hash(pfad, mtime_ns, groesse):
+    h = hashlib.sha256()
+    with open(pfad, "rb") as f:
+        h.update(f.read())
+    return h.hexdigest()[:16]
+
+
+def quell_hash(pfad):
+    """SHA-256 (gekürzt) der Quelldatei; pro Prozess gemerkt, solange sich die Datei nicht ändert"""
+    st = os.stat(pfad)
+    return _hash(pfad, st.st_mtime_ns, st.st_size)
+
+
+def _ziel_pfad(pfad, variante, h):
+    name = os.path.splitext(os.path.basename(pfad))[0]
+    return os.path.join(asset_ordner(), f"{name}_{h}_{variante}.png")
+
+
+def variante_bytes(pfad, breite):
+    """Skaliert die Quelle auf `breite` px (nie größer) und kodiert sie als optimiertes PNG"""
+    with Image.open(pfad) as bild:
+        bild.load()
+    if bild.mode not in ("RGBA", "RGB", "LA", "L"):
+        bild = bild.convert("RGBA")
+    if bild.width > breite:
+        bild = bild.resize((breite, round(bild.height * breite / bild.width)), Image.LANCZOS)
+    # Graustufen-Logo: R = G = B in jedem Pixel -> LA/L ist verlustfrei und kleiner
+    if bild.mode in ("RGBA", "RGB"):
+        r, g, b = bild.split()[:3]
+        if r.tobytes() == g.tobytes() == b.tobytes():
+            bild = bild.convert("LA" if bild.mode == "RGBA" else "L")
+    puffer = io.BytesIO()
+    bild.save(puffer, "PNG", optimize=True)
+    return puffer.getvalue()
+
+
+def _alte_entfernen(pfad, variante, aktuell):
+    # Genau <name>_<16 Hex>_<variante>.png - ein Glob auf <name>_* träfe auch Logos,
+    # deren Name mit <name>_ beginnt (..._blau -> ..._blau_schwarz)
+    name = os.path.splitext(os.path.basename(pfad))[0]
+    muster = re.compile(re.escape(name) + r"_[0-9a-f]{16}_" + re.escape(variante) + r"\.png")
+    ordner = asset_ordner()
+    try:
+        dateien = os.listdir(ordner)
+    except OSError:
+        return
+    for datei in dateien:
+        alt = os.path.join(ordner, datei)
+        if muster.fullmatch(datei) and alt != aktuell:
+            try:
+                os.remove(alt)
+            except OSError:
+                pass
+
+
+def asset(pfad, variante="web"):
+    """Pfad der Variante; wird beim ersten Zugriff erzeugt. Fehlt die Quelle oder ist die
+    Ablage nicht beschreibbar, kommt der Originalpfad zurück (Aufrufer prüfen os.path.exists)."""
+    try:
+        ziel = _ziel_pfad(pfad, variante, quell_hash(pfad))
+        if os.path.exists(ziel):
+            return ziel
+        daten = variante_bytes(pfad, VARIANTEN[variante])
+        os.makedirs(asset_ordner(), exist_ok=True)
+        # Atomar schreiben: Sitzungen laufen als Threads in EINEM Prozess -> eigene
+        # Temp-Datei je Aufruf (mkstemp), nie eine halbe Datei unter dem Zielnamen
+        fd, tmp = tempfile.mkstemp(dir=asset_ordner(), prefix=f".{os.path.basename(ziel)}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(daten)
+            os.replace(tmp, ziel)
+        except OSError:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+        _alte_entfernen(pfad, variante, ziel)
+        return ziel
+    except OSError:
+        return pfad
+
+
+# ==========================================
+# BUILD-SCHRITT + BERICHT
+# ==========================================
+def _pdf_groesse(logo):
+    from fpdf import FPDF
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.image(logo, x=10, y=10, w=100)
+    return len(bytes(pdf.output()))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Logo-Varianten erzeugen (assets_cache)")
+    parser.add_argument("--bericht", action="store_true", help="PDF-Seite mit Logo vorher/nachher messen")
+    args = parser.parse_args(argv)
+
+    quellen = sorted(glob.glob(LOGO_MUSTER))
+    if not quellen:
+        print(f"Keine Logos ({LOGO_MUSTER}) im aktuellen Ordner.")
+        return 1
+
+    print(f"{'Logo':<48} {'Original':>10} " + " ".join(f"{v:>10}" for v in VARIANTEN))
+    summe_vorher = summe_nachher = 0
+    for quelle in quellen:
+        vorher = os.path.getsize(quelle)
+        nachher = [os.path.getsize(asset(quelle, v)) for v in VARIANTEN]
+        summe_vorher += vorher
+        summe_nachher += nachher[0]
+        print(f"{quelle:<48} {vorher / 1024:>8.1f}KB " + " ".join(f"{n / 1024:>8.1f}KB" for n in nachher))
+    print(f"\nWeb-Logos gesamt: {summe_vorher / 1024:.0f} KB -> {summe_nachher / 1024:.0f} KB  (Ablage: {asset_ordner()})")
+
+    if args.bericht:
+        logo = "Coolsulting_Logo_ohneHG_outlines_weiß.png"
+        if os.path.exists(logo):
+            vorher, nachher = _pdf_groesse(logo), _pdf_groesse(asset(logo, "pdf"))
+            print(f"PDF-Seite mit Header-Logo: {vorher / 1024:.1f} KB -> {nachher / 1024:.1f} KB")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
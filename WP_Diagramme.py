@@ -0,0 +1,185 @@
+# ==========================================
+# DATEI: WP_Diagramme.py
+# ZEITSTEMPEL: 19.10.2026 - 16:40 Uhr
+#
+# BESCHREIBUNG:
+# Plotly-Layer für Modul 1 und Quickie mit kleinem Payload pro Rerun:
+# - Die Heizlast-Kennlinie ist stückweise linear (ein Knick an der Heizgrenze)
+#   -> es werden nur die Stützpunkte übertragen statt 100 Punkte.
+# - Layout, Template, Linien und Beschriftungen werden einmal pro Sitzung
+#   aufgebaut; bei jedem Rerun werden nur die veränderten Werte gepatcht.
+# - Portfolio-Streudiagramme schalten ab WEBGL_AB Punkten auf WebGL (Scattergl).
+# - Szenario-Band (Quickie): nur P10/P50/P90 über 20 Jahre statt aller Szenarien.
+#
+# "speicher" ist ein dict-ähnlicher Ablageort für die Basis-Figuren, in der App
+# st.session_state (eine Figur pro Sitzung, daher ohne Sperren). Ohne speicher
+# wird jedes Mal eine neue Figur gebaut (z.B. Benchmarks).
+# ==========================================
+
+import numpy as np
+import plotly.graph_objects as go
+
+WEBGL_AB = 1000
+
+FARBEN_LEISTUNG = ['#FF4B4B', '#8B0000', '#3C3C3B']   # Gebäude, Warmwasser, Sperrzeit
+FARBEN_ENERGIE = ['#FF4B4B', '#8B0000', '#D3D3D3']    # Heizung, Warmwasser, Kessel-Verlust
+
+# Reihenfolge der Shapes/Annotations in der Heizlast-Basisfigur
+_WW, _UEBERGANG, _BIVALENZ = 0, 1, 2
+
+
+def _basis(speicher, name, erzeuger):
+    if speicher is None:
+        return erzeuger()
+    schluessel = f"_wp_diagramm_{name}"
+    fig = speicher.get(schluessel)
+    if fig is None:
+        fig = erzeuger()
+        speicher[schluessel] = fig
+    return fig
+
+
+# ==========================================
+# 1. HEIZLAST-KENNLINIE (Modul 1)
+# ==========================================
+def _basis_heizlast():
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=[], y=[], mode='lines', name='Heizlast Gebäude + WW', line=dict(color='#36A9E1', width=3)))
+    # Platzhalter, die pro Rerun gepatcht werden (WW-Grundlast, Bivalenzpunkt)
+    fig.add_hline(y=0, line_dash="dot", line_color="#8B0000", annotation_text="Warmwasser", annotation_position="bottom left")
+    # Annotation für die Übergangszeit passend zur normalen Leserichtung
+    fig.add_vline(x=7, line_width=2, line_dash="dot", line_color="green", annotation_text="Übergang (+7°C)", annotation_position="top right")
+    fig.add_vline(x=0, line_width=2, line_dash="dash", line_color="red", annotation_text="Bivalenzpunkt", annotation_position="top left")
+    fig.update_layout(
+        title="Leistungsbedarf über Außentemperatur",
+        xaxis_title="Außentemperatur (°C)",
+        yaxis_title="Leistung (kW)",
+        # Standard Ansicht (kalt nach warm), kein autorange="reversed"
+        paper_bgcolor='rgba(255,255,255,0.9)',
+        plot_bgcolor='rgba(255,255,255,0.9)',
+        height=400
+    )
+    return fig
+
+
+def heizlast_figur(x, y, load_ww, bivalenz_punkt, speicher=None):
+    """Kennlinie aus Stützpunkten (x, y) + WW-Linie + Bivalenzpunkt"""
+    fig = _basis(speicher, "heizlast", _basis_heizlast)
+    ww_sichtbar = bool(load_ww > 0)
+    with fig.batch_update():
+        fig.data[0].x = np.round(np.asarray(x, dtype=float), 3)
+        fig.data[0].y = np.round(np.asarray(y, dtype=float), 3)
+        fig.layout.shapes[_WW].update(y0=load_ww, y1=load_ww, visible=ww_sichtbar)
+        fig.layout.annotations[_WW].update(y=load_ww, text=f"Warmwasser ({load_ww:.2f} kW)", visible=ww_sichtbar)
+        fig.layout.shapes[_BIVALENZ].update(x0=bivalenz_punkt, x1=bivalenz_punkt)
+        fig.layout.annotations[_BIVALENZ].update(x=bivalenz_punkt)
+    return fig
+
+
+# ==========================================
+# 2. TORTENDIAGRAMME (Modul 1 + Quickie)
+# ==========================================
+def _basis_leistungs_pie():
+    fig = go.Figure(data=[go.Pie(labels=['Gebäude', 'Warmwasser', 'Sperrzeit'], values=[1, 1, 1], hole=.5, sort=False)])
+    fig.update_traces(marker=dict(colors=FARBEN_LEISTUNG, line=dict(color='#FFFFFF', width=2)))
+    fig.update_layout(showlegend=False, paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', margin=dict(t=10, b=10, l=10, r=10))
+    return fig
+
+
+def leistungs_pie_figur(load_building_base, load_ww_base, sperr_aufschlag, speicher=None):
+    fig = _basis(speicher, "leistungs_pie", _basis_leistungs_pie)
+    fig.data[0].values = [round(load_building_base, 3), round(load_ww_base, 3), round(sperr_aufschlag, 3)]
+    return fig
+
+
+def _basis_energie_pie():
+    fig = go.Figure(data=[go.Pie(labels=[], values=[], hole=.4, sort=False)])
+    fig.update_traces(hoverinfo='label+percent+value', textinfo='percent',
+                      marker=dict(colors=FARBEN_ENERGIE, line=dict(color='#FFFFFF', width=2)))
+    fig.update_layout(showlegend=True,
+                      paper_bgcolor='rgba(0,0,0,0)',
+                      plot_bgcolor='rgba(0,0,0,0)',
+                      margin=dict(t=0, b=0, l=0, r=0),
+                      legend=dict(font=dict(color='white')))
+    return fig
+
+
+def energie_pie_figur(heizung, ww, verlust, speicher=None, name="energie_pie"):
+    labels = ['Heizwärme (Haus)', 'Warmwasser', 'Kessel-Verlust']
+    values = [round(heizung), round(ww), round(verlust)]
+    colors = list(FARBEN_ENERGIE)
+
+    # Wenn WW 0 ist, ausblenden
+    if ww <= 0:
+        labels.pop(1)
+        values.pop(1)
+        colors.pop(1)
+
+    fig = _basis(speicher, name, _basis_energie_pie)
+    with fig.batch_update():
+        fig.data[0].labels = labels
+        fig.data[0].values = values
+        fig.data[0].marker.colors = colors
+    return fig
+
+
+# ==========================================
+# 3. PORTFOLIO (viele Gebäude)
+# ==========================================
+def portfolio_streudiagramm(flaechen, lasten, texte=None, webgl=None):
+    """Heizlast über Fläche. Ab WEBGL_AB Punkten (oder webgl=True) als Scattergl."""
+    flaechen = np.asarray(flaechen, dtype=float)
+    lasten = np.asarray(lasten, dtype=float)
+    if webgl is None:
+        webgl = len(flaechen) >= WEBGL_AB
+    trace_typ = go.Scattergl if webgl else go.Scatter
+    fig = go.Figure(trace_typ(
+        x=flaechen, y=np.round(lasten, 2), mode='markers', text=texte,
+        marker=dict(color='#36A9E1', size=6, line=dict(color='#3C3C3B', width=0.5)),
+        hovertemplate="%{text}<br>%{x:.0f} m² -> %{y:.2f} kW<extra></extra>" if texte is not None else None,
+    ))
+    fig.update_layout(
+        xaxis_title="Beheizte Fläche (m²)",
+        yaxis_title="Heizleistung (kW)",
+        paper_bgcolor='rgba(255,255,255,0.9)',
+        plot_bgcolor='rgba(255,255,255,0.9)',
+        height=400,
+        margin=dict(t=30, b=40, l=50, r=20),
+    )
+    return fig
+
+
+# ==========================================
+# 4. SZENARIO-BAND (Quickie, Betriebskosten)
+# ==========================================
+def _basis_szenario_band():
+    fig = go.Figure()
+    # Unteres Perzentil unsichtbar, oberes füllt bis dorthin -> Band
+    fig.add_trace(go.Scatter(x=[], y=[], mode='lines', line=dict(width=0), showlegend=False, hoverinfo='skip'))
+    fig.add_trace(go.Scatter(x=[], y=[], mode='lines', line=dict(width=0), fill='tonexty',
+                             fillcolor='rgba(54,169,225,0.25)', name='P10 - P90'))
+    fig.add_trace(go.Scatter(x=[], y=[], mode='lines+markers', line=dict(color='#36A9E1', width=3), name='Median'))
+    fig.add_hline(y=0, line_dash="dash", line_color="#FF4B4B", annotation_text="Mehrinvestition", annotation_position="top left")
+    fig.update_layout(
+        xaxis_title="Jahr",
+        yaxis_title="Kumulierte Ersparnis (EUR)",
+        paper_bgcolor='rgba(255,255,255,0.9)',
+        plot_bgcolor='rgba(255,255,255,0.9)',
+        height=350,
+        margin=dict(t=30, b=40, l=60, r=20),
+        legend=dict(orientation="h", y=1.1),
+    )
+    return fig
+
+
+def szenario_band_figur(jahre, kumuliert, mehrinvestition, speicher=None, name="szenario_band"):
+    """Kumulierte Ersparnis (Szenarien x Jahre) als Perzentil-Band + Linie der Mehrinvestition"""
+    p10, p50, p90 = np.round(np.percentile(kumuliert, [10, 50, 90], axis=0))
+    fig = _basis(speicher, name, _basis_szenario_band)
+    with fig.batch_update():
+        fig.data[0].update(x=jahre, y=p10)
+        fig.data[1].update(x=jahre, y=p90)
+        fig.data[2].update(x=jahre, y=p50)
+        fig.layout.shapes[0].update(y0=mehrinvestition, y1=mehrinvestition)
+        fig.layout.annotations[0].update(y=mehrinvestition, text=f"Mehrinvestition ({mehrinvestition:,.0f} EUR)")
+    return fig
@@ -0,0 +1,260 @@
+# ==========================================
+# DATEI: WP_Export.py
+# ZEITSTEMPEL: 20.10.2026 - 09:00 Uhr
+#
+# BESCHREIBUNG:
+# Bearbeitbare Exporte der Modul-1-Auslegung für das Backoffice:
+# - Excel (.xlsx, openpyxl im write_only-Modus): Zeilen werden gestreamt,
+#   der Speicherbedarf bleibt auch bei Portfolios mit tausenden Gebäuden konstant.
+# - Word (.docx, python-docx): Auslegung als Tabellen + Hinweise.
+# Grundlage sind dieselben Werte, die create_pdf_report bekommt (bericht_daten).
+# Alle Exporte entstehen direkt als Bytes im Speicher (für st.download_button);
+# openpyxl puffert die Zeilen intern in einer eigenen, selbst gelöschten Datei.
+# ==========================================
+
+import csv
+import io
+import re
+from datetime import datetime
+
+from docx import Document
+from docx.shared import Pt, RGBColor
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill
+
+BLAU = "36A9E1"
+
+# Präfixe der Hinweise in der UI (siehe create_pdf_report)
+HINWEIS_EMOJI = ("ℹ️ ", "✅ ", "❄️ ", "⚠️ ", "⛔ ", "🔥 ")
+
+MIME_XLSX = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+MIME_DOCX = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
+
+PORTFOLIO_SPALTEN = ("Projekt", "Fläche (m²)", "Spez. Last (W/m²)", "Personen", "Sperrzeit (h)", "Normtemp. (°C)",
+                     "Gebäude (kW)", "Sperrzeit-Zuschlag (kW)", "Warmwasser (kW)", "Heizlast gesamt (kW)", "Last bei +7°C (kW)")
+
+# Wie der Slider in Modul 1; ab der Heizgrenze (15 °C) wäre die Kennlinie nicht definiert
+NORMTEMP_MIN, NORMTEMP_MAX = -25, 0
+
+# Deutsches Zahlenformat in Semikolon-CSV (Excel-DE): 1.200,5 / 1200,5 / 1200
+DE_ZAHL = re.compile(r"-?(\d{1,3}(\.\d{3})+|\d+)(,\d+)?")
+
+
+# ==========================================
+# 1. GEMEINSAME BERICHTSDATEN
+# ==========================================
+def _klartext(text):
+    """HTML-Tags und Emoji aus den Hinweisen der UI entfernen (wie im PDF)"""
+    text = re.sub(r"</?b>", "", text)
+    for emoji in HINWEIS_EMOJI:
+        text = text.replace(emoji, "")
+    return text.strip()
+
+
+def bericht_daten(projekt, bearbeiter, firma, flaeche, bauweise, wm2, total_kw,
+                  load_b, load_ww, sperr_kw, sperrzeit,
+                  norm_temp, vl_temp, system, bivalenz, backup_typ, infos, warnings, critical, kennlinie=()):
+    """Gleiche Argumente wie create_pdf_report (+ Kennlinie als [(°C, kW, Betrieb), ...])"""
+    return {
+        "projekt": projekt,
+        "datum": datetime.now().strftime("%d.%m.%Y"),
+        "bearbeiter": bearbeiter,
+        "firma": firma,
+        "total_kw": total_kw,
+        # load_b enthält den Sperrzeit-Zuschlag bereits -> aufteilen, damit die Summe stimmt
+        "lasten": [
+            (f"Gebäude ({flaeche} m², {bauweise}, {wm2} W/m²)", load_b - sperr_kw),
+            (f"Zuschlag Sperrzeit/Nachtbetrieb ({sperrzeit} Std./Tag)", sperr_kw),
+            ("Warmwasser-Zuschlag", load_ww),
+            ("Empfohlene Heizleistung", total_kw),
+        ],
+        "system": [
+            ("Norm-Außentemperatur", f"{norm_temp} °C"),
+            ("Max. Vorlauftemperatur", f"{vl_temp} °C"),
+            ("Wärmeverteilung", system),
+            ("Bivalenz / Backup", f"{backup_typ} ab {bivalenz} °C"),
+        ],
+        "hinweise": [("INFO", _klartext(i)) for i in infos]
+                    + [("WARNUNG", _klartext(w)) for w in warnings]
+                    + [("KRITISCH", _klartext(c)) for c in critical],
+        "kennlinie": list(kennlinie),
+    }
+
+
+# ==========================================
+# 2. EXCEL (write_only, gestreamt)
+# ==========================================
+def _kopfzeile(ws, werte):
+    zellen = []
+    for wert in werte:
+        zelle = WriteOnlyCell(ws, value=wert)
+        zelle.font = Font(bold=True, color="FFFFFF")
+        zelle.fill = PatternFill("solid", fgColor=BLAU)
+        zellen.append(zelle)
+    return zellen
+
+
+def _fett(ws, wert):
+    zelle = WriteOnlyCell(ws, value=wert)
+    zelle.font = Font(bold=True)
+    return zelle
+
+
+def _als_bytes(wb):
+    puffer = io.BytesIO()
+    wb.save(puffer)
+    return puffer.getvalue()
+
+
+def auslegung_xlsx(daten):
+    """Eine Auslegung: Blatt 'Auslegung' (Kopf, Lasten, System, Hinweise) + Blatt 'Kennlinie'"""
+    wb = Workbook(write_only=True)
+
+    ws = wb.create_sheet("Auslegung")
+    ws.column_dimensions["A"].width = 55
+    ws.column_dimensions["B"].width = 30
+    ws.append([_fett(ws, "Wärmepumpen-Auslegung – Modul 1: Heizlast-Berechnung")])
+    ws.append(["Projekt", daten["projekt"]])
+    ws.append(["Datum", daten["datum"]])
+    if daten["bearbeiter"]:
+        ws.append(["Bearbeiter", daten["bearbeiter"]])
+    if daten["firma"]:
+        ws.append(["Firma", daten["firma"]])
+    ws.append([])
+    ws.append(_kopfzeile(ws, ("Lastaufstellung", "Leistung (kW)")))
+    for text, kw in daten["lasten"][:-1]:
+        ws.append([text, round(kw, 2)])
+    text, kw = daten["lasten"][-1]
+    ws.append([_fett(ws, text), _fett(ws, round(kw, 2))])
+    ws.append([])
+    ws.append(_kopfzeile(ws, ("System-Parameter", "")))
+    for zeile in daten["system"]:
+        ws.append(list(zeile))
+    if daten["hinweise"]:
+        ws.append([])
+        ws.append(_kopfzeile(ws, ("Hinweise & Empfehlungen", "")))
+        for art, text in daten["hinweise"]:
+            ws.append([f"{art}: {text}"])
+
+    if daten["kennlinie"]:
+        wk = wb.create_sheet("Kennlinie")
+        wk.column_dimensions["C"].width = 25
+        wk.append(_kopfzeile(wk, ("Außentemperatur (°C)", "Leistung (kW)", "Betrieb")))
+        for temp, kw, betrieb in daten["kennlinie"]:
+            wk.append([temp, round(kw, 3), betrieb])
+
+    return _als_bytes(wb)
+
+
+def portfolio_xlsx(ergebnisse, titel="Portfolio"):
+    """Eine Zeile pro Gebäude aus einem Iterator (Reihenfolge wie PORTFOLIO_SPALTEN).
+    Zeilen werden nicht gesammelt -> konstanter Speicher, auch bei zehntausenden Gebäuden."""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet(titel[:31])
+    ws.column_dimensions["A"].width = 30
+    ws.freeze_panes = "A2"
+    ws.append(_kopfzeile(ws, PORTFOLIO_SPALTEN))
+
+    anzahl, summe_kw = 0, 0.0
+    for zeile in ergebnisse:
+        ws.append(zeile)
+        anzahl += 1
+        summe_kw += zeile[9]
+
+    ws.append([])
+    ws.append([_fett(ws, f"Summe ({anzahl} Gebäude)")] + [None] * 8 + [_fett(ws, round(summe_kw, 2))])
+    return _als_bytes(wb)
+
+
+def _zahl(text, trenner):
+    """Semikolon-CSV: deutsches Format (Punkt = Tausender, Komma = Dezimal), sonst Punkt = Dezimal"""
+    text = text.strip()
+    if trenner == ";":
+        if not DE_ZAHL.fullmatch(text):
+            raise ValueError(text)
+        text = text.replace(".", "").replace(",", ".")
+    return float(text)
+
+
+def portfolio_aus_csv(daten, statistik=None):
+    """Liest Gebäude aus CSV (Projekt;Fläche;W/m²[;Personen;Sperrzeit;Normtemp]) als Generator.
+    Kopfzeile und Leerzeilen werden übersprungen. Ungültige Zeilen (Zahlenformat, Fläche/Last <= 0,
+    Personen < 0, Sperrzeit außerhalb 0-23 h, Normtemp außerhalb -25...0 °C) zählt statistik["uebersprungen"]."""
+    if statistik is None:
+        statistik = {}
+    statistik.update(gelesen=0, uebersprungen=0)
+    if isinstance(daten, bytes):
+        daten = daten.decode("utf-8-sig")
+    erste = daten[:daten.find("\n")] if "\n" in daten else daten
+    trenner = ";" if erste.count(";") >= erste.count(",") else ","
+    kopf_moeglich = True
+    for zeile in csv.reader(io.StringIO(daten), delimiter=trenner):
+        if not any(z.strip() for z in zeile):
+            continue
+        erste_zeile, kopf_moeglich = kopf_moeglich, False
+        werte = [z.strip() for z in zeile[1:6]] + [""] * (6 - len(zeile))
+        try:
+            flaeche, wm2 = _zahl(werte[0], trenner), _zahl(werte[1], trenner)
+            personen = int(_zahl(werte[2], trenner)) if werte[2] else 0
+            sperrzeit = int(_zahl(werte[3], trenner)) if werte[3] else 0
+            norm_temp = int(_zahl(werte[4], trenner)) if werte[4] else -12
+        except ValueError:
+            if not erste_zeile:  # erste Zeile ohne Zahlen = Kopfzeile
+                statistik["uebersprungen"] += 1
+            continue
+        if flaeche > 0 and wm2 > 0 and personen >= 0 and 0 <= sperrzeit < 24 and NORMTEMP_MIN <= norm_temp <= NORMTEMP_MAX:
+            statistik["gelesen"] += 1
+            yield {"projekt": zeile[0].strip(), "flaeche": flaeche, "wm2": wm2, "personen": personen,
+                   "sperrzeit": sperrzeit, "norm_temp": norm_temp}
+        else:
+            statistik["uebersprungen"] += 1
+
+
+# ==========================================
+# 3. WORD
+# ==========================================
+def auslegung_docx(daten):
+    doc = Document()
+    doc.add_heading("Wärmepumpen-Auslegung", level=0)
+    doc.add_paragraph("Modul 1: Heizlast-Berechnung")
+
+    doc.add_heading(f"Projekt: {daten['projekt']}", level=1)
+    kopf = f"Datum: {daten['datum']}"
+    if daten["bearbeiter"]: kopf += f"  |  Bearbeiter: {daten['bearbeiter']}"
+    if daten["firma"]: kopf += f"  |  Firma: {daten['firma']}"
+    doc.add_paragraph(kopf)
+
+    absatz = doc.add_paragraph()
+    absatz.add_run("Empfohlene Heizleistung (gemäß Auslegungsparameter): ")
+    lauf = absatz.add_run(f"{daten['total_kw']:.2f} kW")
+    lauf.bold = True
+    lauf.font.size = Pt(16)
+    lauf.font.color.rgb = RGBColor.from_string(BLAU)
+
+    doc.add_heading("Detaillierte Lastaufstellung", level=2)
+    tabelle = doc.add_table(rows=0, cols=2)
+    tabelle.style = "Light Grid Accent 1"
+    for i, (text, kw) in enumerate(daten["lasten"]):
+        zellen = tabelle.add_row().cells
+        zellen[0].text = text
+        zellen[1].text = f"{kw:.2f} kW" if i in (0, len(daten["lasten"]) - 1) else f"+ {kw:.2f} kW"
+
+    doc.add_heading("System-Parameter", level=2)
+    tabelle = doc.add_table(rows=0, cols=2)
+    tabelle.style = "Light Grid Accent 1"
+    for text, wert in daten["system"]:
+        zellen = tabelle.add_row().cells
+        zellen[0].text = text
+        zellen[1].text = str(wert)
+
+    if daten["hinweise"]:
+        doc.add_heading("Hinweise & Empfehlungen", level=2)
+        farben = {"INFO": "006400", "WARNUNG": "C89600", "KRITISCH": "C80000"}
+        for art, text in daten["hinweise"]:
+            lauf = doc.add_paragraph(style="List Bullet").add_run(f"{art}: {text}")
+            lauf.font.color.rgb = RGBColor.from_string(farben[art])
+
+    puffer = io.BytesIO()
+    doc.save(puffer)
+    return puffer.getvalue()
@@ -0,0 +1,209 @@
+# ==========================================
+# DATEI: WP_Kaskade.py
+# ZEITSTEMPEL: 19.10.2026 - 22:40 Uhr
+#
+# BESCHREIBUNG:
+# Kaskaden-Auslegung für Modul 1: günstigste Kombination aus bis zu
+# max_geraete Wärmepumpen eines Katalogs, die
+#   1. die Auslegungslast (total_kw) abdeckt,
+#   2. bis zur kleinsten Teillast herunter moduliert (Sommer: WW-Grundlast,
+#      ohne WW: Last knapp unter der Heizgrenze) und
+#   3. dazwischen ohne Lücke regelt (Geräte werden der Größe nach zugeschaltet,
+#      das nächste Gerät muss innerhalb der Modulationsbreite der laufenden starten).
+#
+# SUCHE:
+# - Dominierte Modelle (größer/gleich, tiefer/gleich modulierend, billiger/gleich) fliegen vorab raus.
+# - Tiefensuche über Multimengen (Geräte aufsteigend nach kW max), Abbruch über
+#   Preis-Untergrenze (restliche kW x günstigster EUR/kW) und Kapazitäts-Obergrenze.
+# - Memo: je Zustand (letztes Modell, freie Plätze, kW max, Modulationsbreite) der
+#   günstigste bisher erreichte Preis -> teurere Wege in denselben Zustand werden verworfen.
+# -> Kataloge mit einigen hundert Modellen in wenigen Millisekunden bis ~100 ms.
+#
+# KATALOG:
+# Liste von dicts {"modell", "kw_max", "kw_min", "preis"}. Ohne Hersteller-Daten wird
+# ein Beispiel-Katalog mit Richtwerten verwendet; eigene Kataloge als CSV
+# (Modell;kW max;kW min;Preis) über katalog_aus_csv(). Mit Semikolon gilt das deutsche
+# Zahlenformat (12.500 = 12500, 2,5 = 2.5), mit Komma als Trenner Punkt = Dezimal.
+# ==========================================
+
+import csv
+import io
+import math
+import re
+
+import numpy as np
+
+MAX_GERAETE = 4
+RASTER_KW = 0.1  # Auflösung der Memo-Zustände
+
+# Deutsches Zahlenformat in Semikolon-CSV (Excel-DE): 12.500 / 12.500,50 / 2,5 / 12
+DE_ZAHL = re.compile(r"-?(\d{1,3}(\.\d{3})+|\d+)(,\d+)?")
+
+
+# ==========================================
+# 1. KATALOG
+# ==========================================
+def beispiel_katalog():
+    """Richtwerte (keine Herstellerdaten): zwei Baureihen mit 20 % bzw. 30 % Modulation"""
+    katalog = []
+    for kw in (4, 5, 6, 8, 10, 12, 14, 16, 19, 22, 26, 30, 35, 40, 50, 60, 70, 80, 100):
+        basis = 4500 + 520 * kw ** 0.85
+        katalog.append({"modell": f"L/W Standard {kw} kW", "kw_max": float(kw), "kw_min": round(kw * 0.30, 1), "preis": round(basis, -1)})
+        katalog.append({"modell": f"L/W Inverter {kw} kW", "kw_max": float(kw), "kw_min": round(kw * 0.20, 1), "preis": round(basis * 1.25, -1)})
+    return katalog
+
+
+def _zahl(text, trenner):
+    text = str(text).strip()
+    if trenner == ";":
+        if not DE_ZAHL.fullmatch(text):
+            raise ValueError(text)  # z.B. "12.5": Tausender oder Dezimal? -> Zeile verwerfen
+        text = text.replace(".", "").replace(",", ".")
+    return float(text)
+
+
+def katalog_aus_csv(daten):
+    """CSV (Bytes oder Text) mit Spalten Modell;kW max;kW min;Preis -> Katalog. Kopfzeile optional."""
+    if isinstance(daten, bytes):
+        daten = daten.decode("utf-8-sig")
+    trenner = ";" if daten.count(";") >= daten.count(",") else ","
+    katalog = []
+    for zeile in csv.reader(io.StringIO(daten), delimiter=trenner):
+        if len(zeile) < 4 or not zeile[0].strip():
+            continue
+        try:
+            kw_max, kw_min, preis = _zahl(zeile[1], trenner), _zahl(zeile[2], trenner), _zahl(zeile[3], trenner)
+        except ValueError:
+            continue  # Kopfzeile oder ungültige Zeile
+        if kw_max > 0 and 0 <= kw_min <= kw_max and preis >= 0:
+            katalog.append({"modell": zeile[0].strip(), "kw_max": kw_max, "kw_min": kw_min, "preis": preis})
+    return katalog
+
+
+def nicht_dominiert(katalog):
+    """Entfernt Modelle, die ein anderes in allen drei Kriterien nicht schlägt"""
+    rest = sorted(katalog, key=lambda g: (g["preis"], -g["kw_max"], g["kw_min"]))
+    behalten = []
+    for g in rest:
+        if not any(b["kw_max"] >= g["kw_max"] and b["kw_min"] <= g["kw_min"] for b in behalten):
+            behalten.append(g)
+    return behalten
+
+
+# ==========================================
+# 2. LASTEN AUS DER TEILLAST-KENNLINIE
+# ==========================================
+def lastbereich(total_kw, teillast):
+    """(Mindestlast, Auslegungslast) aus den Werten der Kennlinie bis zur Heizgrenze.
+    Mindestlast = kleinster positiver Wert (WW-Grundlast bzw. Last knapp unter der Heizgrenze)."""
+    werte = np.asarray(teillast, dtype=float)
+    positiv = werte[werte > 0]
+    mindestlast = float(positiv.min()) if positiv.size else 0.0
+    return mindestlast, max(float(total_kw), float(werte.max(initial=0.0)))
+
+
+def kaskade_pruefen(geraete, mindestlast, auslegungslast):
+    """Prüft eine fertige Kombination (Reihenfolge egal) auf die drei Bedingungen"""
+    geraete = sorted(geraete, key=lambda g: (g["kw_max"], g["kw_min"]))
+    if not geraete or geraete[0]["kw_min"] > mindestlast + 1e-9:
+        return False
+    summe_max = summe_min = 0.0
+    for g in geraete:
+        if summe_max and summe_min + g["kw_min"] > summe_max + 1e-9:
+            return False
+        summe_max += g["kw_max"]
+        summe_min += g["kw_min"]
+    return summe_max >= auslegungslast - 1e-9
+
+
+# ==========================================
+# 3. OPTIMIERUNG
+# ==========================================
+def optimiere_kaskade(total_kw, teillast, katalog, max_geraete=MAX_GERAETE):
+    """Günstigste Kaskade für die Kennlinie. Rückgabe: dict mit "geraete", "preis",
+    "kw_max", "kw_min", "mindestlast", "auslegungslast", "mindestlast_erreicht", "zustaende".
+    Erreicht kein Modell die Mindestlast, wird mit dem kleinsten kw_min des Katalogs
+    gerechnet (notfalls ganz ohne diese Bedingung) und mindestlast_erreicht=False gesetzt
+    (Pufferspeicher nötig). None ohne Lösung."""
+    mindestlast, auslegungslast = lastbereich(total_kw, teillast)
+    modelle = sorted(nicht_dominiert(katalog), key=lambda g: (g["kw_max"], g["kw_min"]))
+    if not modelle or auslegungslast <= 0:
+        return None
+
+    kleinstes_min = min(g["kw_min"] for g in modelle)
+    erreicht = kleinstes_min <= mindestlast + 1e-9
+    grenzen = (mindestlast,) if erreicht else (kleinstes_min, math.inf)
+
+    n = len(modelle)
+    kw_max = [g["kw_max"] for g in modelle]
+    kw_min = [g["kw_min"] for g in modelle]
+    preis = [g["preis"] for g in modelle]
+    # Ab Index i: größtes Gerät (=letztes) und günstigster Preis pro kW
+    eur_pro_kw_ab = [0.0] * n
+    bester = math.inf
+    for i in range(n - 1, -1, -1):
+        bester = min(bester, preis[i] / kw_max[i])
+        eur_pro_kw_ab[i] = bester
+    groesstes = kw_max[-1]
+    breite_deckel = max(kw_min)  # mehr Modulationsbreite bringt nichts mehr
+
+    beste = {"preis": math.inf, "auswahl": None}
+    memo = {}
+
+    def suche(grenze, start, plaetze, summe_max, summe_min, kosten, auswahl):
+        rest = auslegungslast - summe_max
+        if rest <= 1e-9:
+            if kosten < beste["preis"]:
+                beste["preis"], beste["auswahl"] = kosten, tuple(auswahl)
+            return
+        if plaetze == 0 or plaetze * groesstes < rest - 1e-9:
+            return
+        if kosten + rest * eur_pro_kw_ab[start] >= beste["preis"]:
+            return
+
+        breite = min(summe_max - summe_min, breite_deckel)
+        zustand = (start, plaetze, round(summe_max / RASTER_KW), round(breite / RASTER_KW))
+        if memo.get(zustand, math.inf) <= kosten:
+            return
+        memo[zustand] = kosten
+
+        for j in range(start, n):
+            if auswahl:
+                # Nächstes Gerät muss innerhalb der Modulationsbreite der laufenden starten
+                if kw_min[j] > summe_max - summe_min + 1e-9:
+                    continue
+            elif kw_min[j] > grenze + 1e-9:
+                continue
+            auswahl.append(j)
+            suche(grenze, j, plaetze - 1, summe_max + kw_max[j], summe_min + kw_min[j], kosten + preis[j], auswahl)
+            auswahl.pop()
+
+    for grenze in grenzen:
+        memo.clear()
+        suche(grenze, 0, max_geraete, 0.0, 0.0, 0.0, [])
+        if beste["auswahl"] is not None:
+            break
+    else:
+        return None
+    geraete = [modelle[j] for j in beste["auswahl"]]
+    return {
+        "geraete": geraete,
+        "preis": beste["preis"],
+        "kw_max": sum(g["kw_max"] for g in geraete),
+        "kw_min": geraete[0]["kw_min"],
+        "mindestlast": mindestlast,
+        "auslegungslast": auslegungslast,
+        "mindestlast_erreicht": erreicht,
+        "zustaende": len(memo),
+    }
+
+
+def zusammenfassen(geraete):
+    """Gleiche Modelle zählen: [(anzahl, gerät), ...] in Zuschalt-Reihenfolge"""
+    gruppen = []
+    for g in geraete:
+        if gruppen and gruppen[-1][1] is g:
+            gruppen[-1][0] += 1
+        else:
+            gruppen.append([1, g])
+    return [(anzahl, g) for anzahl, g in gruppen]
@@ -1,17 +1,74 @@
 # ==========================================
 # DATEI: WP_Quick_Kalkulator.py
-# ZEITSTEMPEL: 10.02.2026 - 14:30 Uhr
+# ZEITSTEMPEL: 20.10.2026 - 09:30 Uhr
 #
 # ÄNDERUNGEN:
 # 1. Clean Code: Fehlerhafte Zeichen am Anfang entfernt.
 # 2. Farben: Heizung (Hellrot), WW (Dunkelrot), Verlust (Hellgrau).
 # 3. Logik: 2000h (ohne WW) vs 2400h (mit WW).
 # 4. Fix: Streamlit Warning (width="stretch").
+# 5. Monitoring: Laufzeit-Messung für CSS, Widgets und Plotly (Laufzeit_Monitor.py).
+# 6. Struktur: calculate_heizlast / plot_energy_pie auf Modulebene (für Benchmark_Suite.py).
+# 7. Performance: Gas- und Öl-Tab als st.fragment, Ergebnisse nach dem ersten Klick live, Diagramm memoisiert.
+#    Fragment-Reruns werden selbst profiliert (Rerun_Profiler.py) und gemessen/exportiert (Laufzeit_Monitor.py).
+# 8. Diagramme: Torte über WP_Diagramme.py (Basis-Figur pro Sitzung, nur Werte werden gepatcht).
+# 9. Betriebskosten & CO2: Szenario-Rechner Kessel vs. WP über 20 Jahre (WP_Szenarien.py), CSV-Export.
+# 10. Logo in Anzeigegröße aus assets_cache (WP_Assets.py) statt 4009-px-Original.
 # ==========================================
 
 import streamlit as st
 import os
-import plotly.graph_objects as go
+import WP_Diagramme as diagramme
+import WP_Szenarien as szenarien
+from WP_Assets import asset
+import time
+from Laufzeit_Monitor import messung, erfassen_seit, rerun_messung
+from Rerun_Profiler import profiliere_rerun
+
+# ==========================================
+# LOGIK-FUNKTION
+# ==========================================
+def calculate_heizlast(verbrauch_kwh, wirkungsgrad, hat_ww, personen):
+    # A. Kesselverluste
+    verlust_kwh = verbrauch_kwh * (1 - wirkungsgrad)
+
+    # B. Nutzenergie
+    nutzenergie_gesamt = verbrauch_kwh * wirkungsgrad
+
+    ww_anteil = 0
+    heizstunden = 2000 # Default
+
+    # LOGIK-WEICHE
+    if hat_ww:
+        # MIT WW: Abzug + 2400h
+        ww_anteil = personen * (1.45 * 2.0) * 365
+        heizstunden = 2400
+    else:
+        # OHNE WW: Kein Abzug + 2000h
+        ww_anteil = 0
+        heizstunden = 2000
+
+    # C. Heizenergie Pur
+    heizenergie_pur = nutzenergie_gesamt - ww_anteil
+
+    if heizenergie_pur < 0:
+        # Gleiche 5 Werte wie im Normalfall; Aufrufer erkennen den Fehler an heizenergie_pur < 0
+        return 0, heizenergie_pur, ww_anteil, verlust_kwh, "Fehler: WW > Verbrauch"
+
+    # D. Heizlast
+    heizlast = heizenergie_pur / heizstunden
+
+    # Rechenweg String
+    rechenweg_str = f"({verbrauch_kwh:,.0f} * {wirkungsgrad:.2f} - {ww_anteil:,.0f} [WW]) / {heizstunden} h = {heizlast:.2f} kW"
+
+    return heizlast, heizenergie_pur, ww_anteil, verlust_kwh, rechenweg_str
+
+# ==========================================
+# DIAGRAMM ERSTELLEN (Plotly)
+# ==========================================
+def plot_energy_pie(heizung, ww, verlust, speicher=None, name="energie_pie"):
+    # FARBEN: Heizung(Hellrot), WW(Dunkelrot), Verlust(Hellgrau), WW = 0 wird ausgeblendet
+    return diagramme.energie_pie_figur(heizung, ww, verlust, speicher, name)
 
 def main():
     # ==========================================
@@ -28,6 +85,7 @@ def main():
     # ==========================================
     # 2. CSS STYLING
     # ==========================================
+    t_css = time.perf_counter()
     st.markdown(f"""
         <style>
         * {{ 
@@ -66,6 +124,7 @@ def main():
         }}
         </style>
     """, unsafe_allow_html=True)
+    erfassen_seit("quickie.css", t_css)
 
     # ==========================================
     # 3. HEADER
@@ -75,7 +134,7 @@ def main():
         st.markdown(f'<h1 class="header-text">WP Quick-Kalkulator</h1>', unsafe_allow_html=True)
         st.markdown(f'<p class="header-text" style="font-size: 20px;">Heizlast-Ermittlung nach Verbrauch</p>', unsafe_allow_html=True)
     with col2:
-        logo = "Coolsulting_Logo_ohneHG_outlines_weiß.png"
+        logo = asset("Coolsulting_Logo_ohneHG_outlines_weiß.png")
         if os.path.exists(logo):
             # Fix für Warning: width="stretch" statt use_container_width=True
             st.image(logo, width="stretch")
@@ -84,155 +143,188 @@ def main():
     st.write("---")
 
     # ==========================================
-    # 4. LOGIK-FUNKTION
-    # ==========================================
-    def calculate_heizlast(verbrauch_kwh, wirkungsgrad, hat_ww, personen):
-        # A. Kesselverluste
-        verlust_kwh = verbrauch_kwh * (1 - wirkungsgrad)
-        
-        # B. Nutzenergie
-        nutzenergie_gesamt = verbrauch_kwh * wirkungsgrad
-        
-        ww_anteil = 0
-        heizstunden = 2000 # Default
-        
-        # LOGIK-WEICHE
-        if hat_ww:
-            # MIT WW: Abzug + 2400h
-            ww_anteil = personen * (1.45 * 2.0) * 365
-            heizstunden = 2400
-        else:
-            # OHNE WW: Kein Abzug + 2000h
-            ww_anteil = 0
-            heizstunden = 2000
-        
-        # C. Heizenergie Pur
-        heizenergie_pur = nutzenergie_gesamt - ww_anteil
-        
-        if heizenergie_pur < 0:
-            return 0, 0, 0, 0, "Fehler: WW > Verbrauch", ""
-
-        # D. Heizlast
-        heizlast = heizenergie_pur / heizstunden
-        
-        # Rechenweg String
-        rechenweg_str = f"({verbrauch_kwh:,.0f} * {wirkungsgrad:.2f} - {ww_anteil:,.0f} [WW]) / {heizstunden} h = {heizlast:.2f} kW"
-        
-        return heizlast, heizenergie_pur, ww_anteil, verlust_kwh, rechenweg_str
-
-    # ==========================================
-    # 5. DIAGRAMM ERSTELLEN (Plotly)
-    # ==========================================
-    def plot_energy_pie(heizung, ww, verlust):
-        labels = ['Heizwärme (Haus)', 'Warmwasser', 'Kessel-Verlust']
-        values = [heizung, ww, verlust]
-        
-        # FARBEN DEFINIEREN: Heizung(Hellrot), WW(Dunkelrot), Verlust(Hellgrau)
-        colors = ['#FF4B4B', '#8B0000', '#D3D3D3'] 
-        
-        # Wenn WW 0 ist, ausblenden
-        if ww <= 0:
-            labels.pop(1)
-            values.pop(1)
-            colors.pop(1)
-            
-        fig = go.Figure(data=[go.Pie(labels=labels, values=values, hole=.4, sort=False)])
-        fig.update_traces(hoverinfo='label+percent+value', textinfo='percent', 
-                          marker=dict(colors=colors, line=dict(color='#FFFFFF', width=2)))
-        fig.update_layout(showlegend=True, 
-                          paper_bgcolor='rgba(0,0,0,0)',
-                          plot_bgcolor='rgba(0,0,0,0)',
-                          margin=dict(t=0, b=0, l=0, r=0),
-                          legend=dict(font=dict(color='white')))
-        return fig
-
-    # ==========================================
-    # 6. TABS & INPUTS
+    # 4. TABS & INPUTS
     # ==========================================
     tab1, tab2 = st.tabs(["🔥 GAS-ERSATZ", "🛢️ ÖL-ERSATZ"])
 
     # --- GAS ---
     with tab1:
-        c1, c2 = st.columns(2)
-        with c1:
-            v_gas = st.number_input("Jahresverbrauch Gas", 1000, 200000, 25000, key="qk_g_v")
-            einheit = st.radio("Einheit", ["kWh", "m³"], horizontal=True, key="qk_g_e")
-            wirk_gas = st.slider("Wirkungsgrad Altkessel (%)", 60, 105, 85, key="qk_g_w") / 100
-        
-        with c2:
-            st.markdown("<b>Warmwasser-Einstellungen</b>", unsafe_allow_html=True)
-            ww_gas_active = st.checkbox("Warmwasser über Gasheizung?", value=True, key="qk_g_ww")
-            
-            if ww_gas_active:
-                pers_gas = st.slider("Personen im Haushalt", 1, 6, 3, key="qk_g_p")
-                st.markdown(f"<span style='font-size:12px; opacity:0.7;'>Formel: 1,45 kWh x 2 x {pers_gas} Pers.</span>", unsafe_allow_html=True)
-            else:
-                pers_gas = 0
-
-        if st.button("BERECHNUNG STARTEN (GAS)"):
-            input_kwh = v_gas * 10.5 if einheit == "m³" else v_gas
-            
-            hl, heiz_e, ww_e, verlust_e, pfad = calculate_heizlast(input_kwh, wirk_gas, ww_gas_active, pers_gas)
-            
-            res_c1, res_c2 = st.columns([1, 1])
-            with res_c1:
-                st.markdown(f'<p style="color:white; font-size:18px;">Empfohlene Heizlast:</p>', unsafe_allow_html=True)
-                st.markdown(f'<p class="result-highlight">{hl:.2f} kW</p>', unsafe_allow_html=True)
-                st.markdown(f'<div class="rechenweg"><b>RECHENWEG:</b><br>{pfad}</div>', unsafe_allow_html=True)
-                st.markdown(f"""
-                <div style='margin-top:20px; color:white;'>
-                <b>Energie-Bilanz:</b><br>
-                Eingesetzte Energie: {input_kwh:,.0f} kWh<br>
-                Davon genutzt: {(heiz_e + ww_e):,.0f} kWh ({(heiz_e + ww_e)/input_kwh*100:.1f}%)
-                </div>
-                """, unsafe_allow_html=True)
-
-            with res_c2:
-                st.markdown('<p style="color:white; text-align:center;">Verbrauchs-Aufteilung</p>', unsafe_allow_html=True)
-                fig = plot_energy_pie(heiz_e, ww_e, verlust_e)
-                # Fix für Warning: width="stretch"
-                st.plotly_chart(fig, use_container_width=True)
+        gas_rechner()
 
     # --- ÖL ---
     with tab2:
-        c1, c2 = st.columns(2)
+        oel_rechner()
+
+# ==========================================
+# 5. RECHNER ALS FRAGMENTE
+# Eine Eingabe rerunnt nur den eigenen Tab (ohne CSS, Header und central STATION).
+# Nach dem ersten Klick folgen die Ergebnisse jeder Eingabe live.
+# ==========================================
+@st.fragment
+def gas_rechner():
+    with profiliere_rerun(), rerun_messung("quickie.fragment"):
+        _gas_inhalt()
+
+def _gas_inhalt():
+    t_widgets = time.perf_counter()
+    c1, c2 = st.columns(2)
+    with c1:
+        v_gas = st.number_input("Jahresverbrauch Gas", 1000, 200000, 25000, key="qk_g_v")
+        einheit = st.radio("Einheit", ["kWh", "m³"], horizontal=True, key="qk_g_e")
+        wirk_gas = st.slider("Wirkungsgrad Altkessel (%)", 60, 105, 85, key="qk_g_w") / 100
+
+    with c2:
+        st.markdown("<b>Warmwasser-Einstellungen</b>", unsafe_allow_html=True)
+        ww_gas_active = st.checkbox("Warmwasser über Gasheizung?", value=True, key="qk_g_ww")
+
+        if ww_gas_active:
+            pers_gas = st.slider("Personen im Haushalt", 1, 6, 3, key="qk_g_p")
+            st.markdown(f"<span style='font-size:12px; opacity:0.7;'>Formel: 1,45 kWh x 2 x {pers_gas} Pers.</span>", unsafe_allow_html=True)
+        else:
+            pers_gas = 0
+    erfassen_seit("quickie.widgets", t_widgets)
+
+    if st.button("BERECHNUNG STARTEN (GAS)"):
+        st.session_state.qk_g_berechnet = True
+
+    if st.session_state.get("qk_g_berechnet"):
+        input_kwh = v_gas * 10.5 if einheit == "m³" else v_gas
+
+        hl, heiz_e, ww_e, verlust_e, pfad = calculate_heizlast(input_kwh, wirk_gas, ww_gas_active, pers_gas)
+        if heiz_e < 0:
+            # Live-Eingabe im Fragment -> kein try/except der central STATION dazwischen
+            st.error(f"{pfad}: Der Warmwasser-Anteil ({ww_e:,.0f} kWh) übersteigt die genutzte Energie.")
+            return
+
+        res_c1, res_c2 = st.columns([1, 1])
+        with res_c1:
+            st.markdown(f'<p style="color:white; font-size:18px;">Empfohlene Heizlast:</p>', unsafe_allow_html=True)
+            st.markdown(f'<p class="result-highlight">{hl:.2f} kW</p>', unsafe_allow_html=True)
+            st.markdown(f'<div class="rechenweg"><b>RECHENWEG:</b><br>{pfad}</div>', unsafe_allow_html=True)
+            st.markdown(f"""
+            <div style='margin-top:20px; color:white;'>
+            <b>Energie-Bilanz:</b><br>
+            Eingesetzte Energie: {input_kwh:,.0f} kWh<br>
+            Davon genutzt: {(heiz_e + ww_e):,.0f} kWh ({(heiz_e + ww_e)/input_kwh*100:.1f}%)
+            </div>
+            """, unsafe_allow_html=True)
+
+        with res_c2:
+            st.markdown('<p style="color:white; text-align:center;">Verbrauchs-Aufteilung</p>', unsafe_allow_html=True)
+            with messung("quickie.plotly"):
+                fig = plot_energy_pie(heiz_e, ww_e, verlust_e, st.session_state, "energie_pie_gas")
+            # Fix für Warning: width="stretch"
+            st.plotly_chart(fig, width="stretch", key="qk_g_pie")
+
+        szenario_bereich("gas", heiz_e, ww_e, wirk_gas)
+
+@st.fragment
+def oel_rechner():
+    with profiliere_rerun(), rerun_messung("quickie.fragment"):
+        _oel_inhalt()
+
+def _oel_inhalt():
+    t_widgets = time.perf_counter()
+    c1, c2 = st.columns(2)
+    with c1:
+        v_oil = st.number_input("Jahresverbrauch Öl (Liter)", 500, 20000, 2500, key="qk_o_v")
+        wirk_oil = st.slider("Wirkungsgrad Altkessel (%)", 60, 105, 80, key="qk_o_w") / 100
+
+    with c2:
+        st.markdown("<b>Warmwasser-Einstellungen</b>", unsafe_allow_html=True)
+        ww_oil_active = st.checkbox("Warmwasser über Ölheizung?", value=True, key="qk_o_ww")
+
+        if ww_oil_active:
+            pers_oil = st.slider("Personen im Haushalt", 1, 6, 3, key="qk_o_p")
+            st.markdown(f"<span style='font-size:12px; opacity:0.7;'>Formel: 1,45 kWh x 2 x {pers_oil} Pers.</span>", unsafe_allow_html=True)
+        else:
+            pers_oil = 0
+    erfassen_seit("quickie.widgets", t_widgets)
+
+    if st.button("BERECHNUNG STARTEN (ÖL)"):
+        st.session_state.qk_o_berechnet = True
+
+    if st.session_state.get("qk_o_berechnet"):
+        input_kwh_o = v_oil * 10.0
+
+        hl_o, heiz_e_o, ww_e_o, verlust_e_o, pfad_o = calculate_heizlast(input_kwh_o, wirk_oil, ww_oil_active, pers_oil)
+        if heiz_e_o < 0:
+            st.error(f"{pfad_o}: Der Warmwasser-Anteil ({ww_e_o:,.0f} kWh) übersteigt die genutzte Energie.")
+            return
+
+        res_c1, res_c2 = st.columns([1, 1])
+        with res_c1:
+            st.markdown(f'<p style="color:white; font-size:18px;">Empfohlene Heizlast:</p>', unsafe_allow_html=True)
+            st.markdown(f'<p class="result-highlight">{hl_o:.2f} kW</p>', unsafe_allow_html=True)
+            st.markdown(f'<div class="rechenweg"><b>RECHENWEG:</b><br>{pfad_o}</div>', unsafe_allow_html=True)
+            st.markdown(f"""
+            <div style='margin-top:20px; color:white;'>
+            <b>Energie-Bilanz:</b><br>
+            Eingesetzte Energie: {input_kwh_o:,.0f} kWh<br>
+            Davon genutzt: {(heiz_e_o + ww_e_o):,.0f} kWh ({(heiz_e_o + ww_e_o)/input_kwh_o*100:.1f}%)
+            </div>
+            """, unsafe_allow_html=True)
+
+        with res_c2:
+            st.markdown('<p style="color:white; text-align:center;">Verbrauchs-Aufteilung</p>', unsafe_allow_html=True)
+            with messung("quickie.plotly"):
+                fig_o = plot_energy_pie(heiz_e_o, ww_e_o, verlust_e_o, st.session_state, "energie_pie_oel")
+            # Fix für Warning: width="stretch"
+            st.plotly_chart(fig_o, width="stretch", key="qk_o_pie")
+
+        szenario_bereich("oel", heiz_e_o, ww_e_o, wirk_oil)
+
+# ==========================================
+# 6. BETRIEBSKOSTEN & CO2 (Szenarien)
+# Läuft innerhalb des jeweiligen Fragments; alle Szenarien in einem NumPy-Durchlauf.
+# ==========================================
+def szenario_bereich(traeger, heiz_e, ww_e, wirkungsgrad):
+    if heiz_e + ww_e <= 0:
+        return
+    k = f"qk_{traeger[0]}_sz"
+    name = "Gas" if traeger == "gas" else "Öl"
+
+    with st.expander(f"💶 Betriebskosten & CO2 – {name}kessel vs. Wärmepumpe ({szenarien.JAHRE} Jahre)"):
+        c1, c2, c3 = st.columns(3)
         with c1:
-            v_oil = st.number_input("Jahresverbrauch Öl (Liter)", 500, 20000, 2500, key="qk_o_v")
-            wirk_oil = st.slider("Wirkungsgrad Altkessel (%)", 60, 105, 80, key="qk_o_w") / 100
-        
+            scop = st.slider("SCOP Wärmepumpe", 2.5, 5.5, 3.5, 0.1, key=f"{k}_scop")
+            invest = st.number_input("Mehrinvestition WP (EUR, nach Förderung)", 0, 100000, 15000, 500, key=f"{k}_inv")
+            zins = st.slider("Kalkulationszins (%)", 0.0, 8.0, 3.0, 0.5, key=f"{k}_zins") / 100
         with c2:
-            st.markdown("<b>Warmwasser-Einstellungen</b>", unsafe_allow_html=True)
-            ww_oil_active = st.checkbox("Warmwasser über Ölheizung?", value=True, key="qk_o_ww")
-            
-            if ww_oil_active:
-                pers_oil = st.slider("Personen im Haushalt", 1, 6, 3, key="qk_o_p")
-                st.markdown(f"<span style='font-size:12px; opacity:0.7;'>Formel: 1,45 kWh x 2 x {pers_oil} Pers.</span>", unsafe_allow_html=True)
-            else:
-                pers_oil = 0
-
-        if st.button("BERECHNUNG STARTEN (ÖL)"):
-            input_kwh_o = v_oil * 10.0
-            
-            hl_o, heiz_e_o, ww_e_o, verlust_e_o, pfad_o = calculate_heizlast(input_kwh_o, wirk_oil, ww_oil_active, pers_oil)
-            
-            res_c1, res_c2 = st.columns([1, 1])
-            with res_c1:
-                st.markdown(f'<p style="color:white; font-size:18px;">Empfohlene Heizlast:</p>', unsafe_allow_html=True)
-                st.markdown(f'<p class="result-highlight">{hl_o:.2f} kW</p>', unsafe_allow_html=True)
-                st.markdown(f'<div class="rechenweg"><b>RECHENWEG:</b><br>{pfad_o}</div>', unsafe_allow_html=True)
-                st.markdown(f"""
-                <div style='margin-top:20px; color:white;'>
-                <b>Energie-Bilanz:</b><br>
-                Eingesetzte Energie: {input_kwh_o:,.0f} kWh<br>
-                Davon genutzt: {(heiz_e_o + ww_e_o):,.0f} kWh ({(heiz_e_o + ww_e_o)/input_kwh_o*100:.1f}%)
-                </div>
-                """, unsafe_allow_html=True)
-
-            with res_c2:
-                st.markdown('<p style="color:white; text-align:center;">Verbrauchs-Aufteilung</p>', unsafe_allow_html=True)
-                fig_o = plot_energy_pie(heiz_e_o, ww_e_o, verlust_e_o)
-                # Fix für Warning: width="stretch"
-                st.plotly_chart(fig_o, use_container_width=True)
+            preis = st.number_input(f"{name}preis heute (ct/kWh)", 3.0, 40.0, szenarien.PREIS_START[traeger] * 100, 0.5, key=f"{k}_bp") / 100
+            b_lo, b_hi = st.slider(f"Steigerung {name}preis (%/Jahr)", -2.0, 10.0, (1.0, 6.0), 0.5, key=f"{k}_bs")
+            co2_lo, co2_hi = st.slider("Steigerung CO2-Preis (EUR/t pro Jahr)", 0.0, 30.0, (5.0, 15.0), 1.0, key=f"{k}_co2")
+        with c3:
+            strom = st.number_input("WP-Strompreis heute (ct/kWh)", 10.0, 60.0, szenarien.STROMPREIS_START * 100, 0.5, key=f"{k}_sp") / 100
+            s_lo, s_hi = st.slider("Steigerung Strompreis (%/Jahr)", -2.0, 10.0, (0.0, 4.0), 0.5, key=f"{k}_ss")
+            anzahl = st.select_slider("Anzahl Szenarien", [1, 100, 1000, 5000, 10000], 1000, key=f"{k}_n")
+
+        t_start = time.perf_counter()
+        tarife = szenarien.tarif_szenarien(anzahl, traeger, preis, strom, (b_lo / 100, b_hi / 100),
+                                           (s_lo / 100, s_hi / 100), co2_steigerung=(co2_lo, co2_hi))
+        ergebnis = szenarien.berechne_szenarien(heiz_e, ww_e, wirkungsgrad, scop, tarife, traeger, invest, zins)
+        kennzahlen = szenarien.zusammenfassung(ergebnis)
+        erfassen_seit("quickie.szenarien", t_start)
+        dauer_ms = (time.perf_counter() - t_start) * 1000
+
+        m1, m2, m3, m4 = st.columns(4)
+        m1.metric("Ersparnis Jahr 1 (Median)", f"{kennzahlen['ersparnis_jahr1_p50']:,.0f} EUR")
+        m2.metric("Kapitalwert (Median)", f"{kennzahlen['npv_p50']:,.0f} EUR",
+                  help=f"P10: {kennzahlen['npv_p10']:,.0f} EUR / P90: {kennzahlen['npv_p90']:,.0f} EUR")
+        amort = kennzahlen["amortisation_median"]
+        m3.metric("Amortisation (Median)", "nicht erreicht" if amort == float("inf") else f"{amort:.0f} Jahre",
+                  help=f"In {kennzahlen['anteil_amortisiert'] * 100:.0f} % der Szenarien innerhalb von {szenarien.JAHRE} Jahren")
+        m4.metric(f"CO2-Einsparung {szenarien.JAHRE} J.", f"{kennzahlen['co2_ersparnis_gesamt_t']:,.1f} t")
+
+        with messung("quickie.plotly"):
+            fig = diagramme.szenario_band_figur(ergebnis["jahre"], ergebnis["kumuliert"], invest,
+                                                st.session_state, f"szenario_band_{traeger}")
+        st.plotly_chart(fig, width="stretch", key=f"{k}_band")
+
+        st.caption(f"{kennzahlen['szenarien']:,} Szenarien in {dauer_ms:.1f} ms · Kapitalwert positiv in "
+                   f"{kennzahlen['anteil_npv_positiv'] * 100:.0f} % der Szenarien · Strom-CO2 ist im Strompreis (ETS) enthalten.")
+        st.download_button("📥 Szenarien als CSV", data=lambda: szenarien.export_csv(tarife, ergebnis),
+                           file_name=f"Betriebskosten_Szenarien_{name}.csv", mime="text/csv", key=f"{k}_csv")
 
 if __name__ == '__main__':
     main()
\ No newline at end of file
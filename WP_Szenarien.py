@@ -0,0 +1,152 @@
+# ==========================================
+# DATEI: WP_Szenarien.py
+# ZEITSTEMPEL: 19.10.2026 - 22:10 Uhr
+#
+# BESCHREIBUNG:
+# Szenario-Rechner Betriebskosten & CO2: Gas-/Ölkessel gegen Wärmepumpe über
+# 20 Jahre. Grundlage sind heizenergie_pur und ww_anteil aus dem Quickie.
+# Alle Tarif-Szenarien werden gemeinsam als Matrix (Szenarien x Jahre) mit
+# NumPy gerechnet -> einige tausend Szenarien in wenigen Millisekunden.
+#
+# MODELL:
+# - Nutzwärme = heizenergie_pur + ww_anteil
+# - Kessel:  Brennstoff = Nutzwärme / Wirkungsgrad, Kosten = Brennstoff * (Preis + CO2-Preis * Faktor)
+# - WP:      Strom = Nutzwärme / SCOP, Kosten = Strom * Strompreis
+#            (CO2 des Stroms ist über den Emissionshandel bereits im Strompreis enthalten)
+# - Preise steigen je Szenario mit einer eigenen jährlichen Rate
+# - Kapitalwert (NPV) = Summe der abgezinsten Ersparnisse - Mehrinvestition
+# - Amortisation = erstes Jahr, in dem die kumulierte Ersparnis die Mehrinvestition deckt
+# ==========================================
+
+import csv
+import io
+
+import numpy as np
+
+JAHRE = 20
+
+# CO2-Faktoren in kg/kWh (Endenergie)
+CO2_FAKTOR = {"gas": 0.201, "oel": 0.266}
+CO2_FAKTOR_STROM = 0.380
+
+# Standard-Startpreise in EUR/kWh
+PREIS_START = {"gas": 0.12, "oel": 0.11}
+STROMPREIS_START = 0.28
+
+
+def tarif_szenarien(anzahl, traeger="gas", brennstoff_preis=None, strompreis=STROMPREIS_START,
+                    brennstoff_steigerung=(0.01, 0.06), strom_steigerung=(0.00, 0.04),
+                    co2_preis=55.0, co2_steigerung=(5.0, 15.0), seed=42):
+    """Erzeugt `anzahl` Tarif-Szenarien. Szenario 0 ist immer das Mittel der Bandbreiten.
+
+    Steigerungen: (min, max) als jährliche Rate (Preise) bzw. EUR/t pro Jahr (CO2).
+    Rückgabe: dict mit Arrays der Länge `anzahl`.
+    """
+    if brennstoff_preis is None:
+        brennstoff_preis = PREIS_START[traeger]
+    rng = np.random.default_rng(seed)
+
+    def ziehen(bereich):
+        lo, hi = bereich
+        werte = rng.uniform(lo, hi, anzahl)
+        werte[0] = (lo + hi) / 2
+        return werte
+
+    return {
+        "brennstoff_preis": np.full(anzahl, float(brennstoff_preis)),
+        "brennstoff_steigerung": ziehen(brennstoff_steigerung),
+        "strompreis": np.full(anzahl, float(strompreis)),
+        "strom_steigerung": ziehen(strom_steigerung),
+        "co2_preis": np.full(anzahl, float(co2_preis)),
+        "co2_steigerung": ziehen(co2_steigerung),
+    }
+
+
+def preis_pfade(szenarien, jahre=JAHRE):
+    """Preis-Matrizen (Szenarien x Jahre) aus Startpreis und Steigerungsrate"""
+    t = np.arange(jahre)
+    brennstoff = szenarien["brennstoff_preis"][:, None] * (1 + szenarien["brennstoff_steigerung"][:, None]) ** t
+    strom = szenarien["strompreis"][:, None] * (1 + szenarien["strom_steigerung"][:, None]) ** t
+    co2 = szenarien["co2_preis"][:, None] + szenarien["co2_steigerung"][:, None] * t
+    return brennstoff, strom, co2
+
+
+def berechne_szenarien(heizenergie_pur, ww_anteil, wirkungsgrad, scop, szenarien, traeger="gas",
+                       mehrinvestition=15000.0, zins=0.03, jahre=JAHRE, co2_faktor_strom=CO2_FAKTOR_STROM,
+                       strom_co2_minderung=0.03):
+    """Betriebskosten, Kapitalwert und Amortisation für alle Szenarien auf einmal"""
+    nutzwaerme = heizenergie_pur + ww_anteil
+    brennstoff_kwh = nutzwaerme / wirkungsgrad
+    strom_kwh = nutzwaerme / scop
+    faktor = CO2_FAKTOR[traeger]
+
+    brennstoff, strom, co2 = preis_pfade(szenarien, jahre)
+
+    kosten_kessel = brennstoff_kwh * (brennstoff + co2 * faktor / 1000)
+    kosten_wp = strom_kwh * strom
+    ersparnis = kosten_kessel - kosten_wp
+
+    t = np.arange(jahre)
+    abzinsung = 1 / (1 + zins) ** (t + 1)
+    npv = ersparnis @ abzinsung - mehrinvestition
+
+    kumuliert = np.cumsum(ersparnis, axis=1)
+    gedeckt = kumuliert >= mehrinvestition
+    amortisation = np.where(gedeckt.any(axis=1), gedeckt.argmax(axis=1) + 1, np.nan)
+
+    # CO2 in Tonnen pro Jahr (unabhängig vom Tarif; Strom-Mix wird jährlich sauberer)
+    co2_kessel = np.full(jahre, brennstoff_kwh * faktor / 1000)
+    co2_wp = strom_kwh * co2_faktor_strom * (1 - strom_co2_minderung) ** t / 1000
+
+    return {
+        "jahre": t + 1,
+        "kosten_kessel": kosten_kessel,
+        "kosten_wp": kosten_wp,
+        "ersparnis": ersparnis,
+        "kumuliert": kumuliert,
+        "npv": npv,
+        "amortisation": amortisation,
+        "co2_kessel_t": co2_kessel,
+        "co2_wp_t": co2_wp,
+        "brennstoff_kwh": brennstoff_kwh,
+        "strom_kwh": strom_kwh,
+    }
+
+
+def zusammenfassung(ergebnis):
+    """Kennzahlen über alle Szenarien (Perzentile P10 / P50 / P90).
+    Amortisation (Median) über ALLE Szenarien, nicht amortisierte zählen als unendlich
+    -> inf, wenn sich weniger als die Hälfte der Szenarien amortisiert."""
+    npv = ergebnis["npv"]
+    amort = ergebnis["amortisation"]
+    p10, p50, p90 = np.percentile(npv, [10, 50, 90])
+    return {
+        "szenarien": len(npv),
+        "npv_p10": float(p10),
+        "npv_p50": float(p50),
+        "npv_p90": float(p90),
+        "anteil_npv_positiv": float(np.mean(npv > 0)),
+        "amortisation_median": float(np.median(np.where(np.isnan(amort), np.inf, amort))),
+        "anteil_amortisiert": float(np.mean(np.isfinite(amort))),
+        "ersparnis_jahr1_p50": float(np.median(ergebnis["ersparnis"][:, 0])),
+        "co2_ersparnis_gesamt_t": float(np.sum(ergebnis["co2_kessel_t"] - ergebnis["co2_wp_t"])),
+    }
+
+
+def export_csv(szenarien, ergebnis):
+    """CSV (Semikolon, für Excel-DE) mit einer Zeile pro Szenario + Jahreswerten des Basisszenarios"""
+    puffer = io.StringIO()
+    w = csv.writer(puffer, delimiter=";")
+    w.writerow(["Szenario", "Steigerung Brennstoff (%/a)", "Steigerung Strom (%/a)", "CO2-Preis +EUR/t/a",
+                "Kapitalwert (EUR)", "Amortisation (Jahre)"])
+    for i in range(len(ergebnis["npv"])):
+        amort = ergebnis["amortisation"][i]
+        w.writerow([i, f"{szenarien['brennstoff_steigerung'][i] * 100:.2f}", f"{szenarien['strom_steigerung'][i] * 100:.2f}",
+                    f"{szenarien['co2_steigerung'][i]:.1f}", f"{ergebnis['npv'][i]:.0f}",
+                    "" if np.isnan(amort) else int(amort)])
+    w.writerow([])
+    w.writerow(["Jahr", "Kosten Kessel (EUR)", "Kosten WP (EUR)", "Ersparnis (EUR)", "CO2 Kessel (t)", "CO2 WP (t)"])
+    for j in range(len(ergebnis["jahre"])):
+        w.writerow([ergebnis["jahre"][j], f"{ergebnis['kosten_kessel'][0, j]:.0f}", f"{ergebnis['kosten_wp'][0, j]:.0f}",
+                    f"{ergebnis['ersparnis'][0, j]:.0f}", f"{ergebnis['co2_kessel_t'][j]:.2f}", f"{ergebnis['co2_wp_t'][j]:.2f}"])
+    return puffer.getvalue().encode("utf-8-sig")
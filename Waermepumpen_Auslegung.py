@@ -1,25 +1,49 @@
 # ==========================================
 # DATEI: Waermepumpen_Auslegung.py
-# ZEITSTEMPEL: 10.02.2026 - 17:50 Uhr
-# VERSION: 3.8
+# ZEITSTEMPEL: 20.10.2026 - 09:30 Uhr
+# VERSION: 3.9
 #
 # ÄNDERUNGEN:
 # 1. TEXT: Platzhalter bei "Projekt / Kunde" auf "z.B.: Elke Muster" geändert.
 # 2. VERSIONING: App Version auf 3.8 hochgesetzt.
 # 3. BEIBEHALTEN: Striktes Header-Format, gedrehte X-Achse (Kalt -> Warm), Logo & Text oben bündig (Y=10), Disclaimer mit geistigem Eigentum.
+# 4. MONITORING: Laufzeit-Messung für CSS, Widgets, Plotly und PDF (Laufzeit_Monitor.py).
+# 5. STRUKTUR: Berechnung, Lastkurve und Plotly-Diagramme als eigene Funktionen (für Benchmark_Suite.py).
+# 6. PERFORMANCE: Eingaben + Ergebnisse als st.fragment -> Slider rerunnen nur das Cockpit, nicht die central STATION.
+#    Ergebnisse aktualisieren sich nach dem ersten Klick live, Diagramme sind memoisiert, PDF erst beim Download.
+#    Fragment-Reruns werden selbst profiliert (Rerun_Profiler.py) und gemessen/exportiert (Laufzeit_Monitor.py).
+# 7. DIAGRAMME: Kennlinie nur aus Stützpunkten (NumPy), Basis-Figuren pro Sitzung gepatcht (WP_Diagramme.py).
+# 8. KASKADE: Günstigste Kombination mehrerer WP aus einem Katalog (WP_Kaskade.py), eigener Katalog als CSV.
+#    Katalog und Ergebnis pro Sitzung gemerkt -> nur neu gesucht, wenn sich Last, Kennlinie, Datei oder Anzahl ändern.
+# 9. ASSETS: Logo im Header (800 px) und im PDF (300 dpi bei 100 mm) aus assets_cache (WP_Assets.py).
+# 10. EXPORT: Auslegung zusätzlich als Excel/Word, Portfolio (CSV) als Excel (WP_Export.py), alles im Speicher.
+#     Portfolio-Vorschau als Streudiagramm Heizlast über Fläche (ab 1000 Gebäuden WebGL).
 # ==========================================
 
 import streamlit as st
 import os
-import plotly.graph_objects as go
 from fpdf import FPDF
 from datetime import datetime
 import matplotlib.pyplot as plt
 import numpy as np
 import tempfile
+import time
+from functools import partial
+from Laufzeit_Monitor import messung, erfassen_seit, rerun_messung
+from Rerun_Profiler import profiliere_rerun
+import WP_Diagramme as diagramme
+import WP_Kaskade as kaskade
+from WP_Assets import asset
+import WP_Export as export
 
 # Globale Variable für die App-Version (wird in UI und PDF genutzt)
-APP_VERSION = "3.8"
+APP_VERSION = "3.9"
+
+# Heizgrenze: ab dieser Außentemperatur bleibt nur noch die WW-Grundlast
+HEIZGRENZE = 15.0
+
+# Warmwasser-Leistung pro Person in kW (1,45 kWh x 2 pro Tag auf 2400 h)
+WW_FAKTOR = (1.45 * 2.0 * 365) / 2400
 
 # ==========================================
 # 1. PDF KLASSE
@@ -39,7 +63,7 @@ class PDF(FPDF):
         start_y = 10
         
         # Weisses Logo (Breite 100)
-        logo = "Coolsulting_Logo_ohneHG_outlines_weiß.png"
+        logo = asset("Coolsulting_Logo_ohneHG_outlines_weiß.png", "pdf")
         if os.path.exists(logo):
             self.image(logo, x=10, y=start_y, w=100)
             
@@ -101,11 +125,9 @@ def create_charts_for_pdf(load_b, load_ww, sperr_kw, norm_temp, bivalenz_temp, t
 
     # 2. HEIZLAST-KENNLINIE (Gedrehte X-Achse: Kalt links, Warm rechts)
     fig2, ax2 = plt.subplots(figsize=(8, 4))
-    x_temps = np.linspace(norm_temp - 2, 20, 50)
-    heizgrenze = 15.0
-    
     # WW ist die Grundlast. Gebäude-Heizlast kommt dazu, wenn T < 15°C
-    y_loads = [(load_b * (heizgrenze - t) / (heizgrenze - norm_temp)) + load_ww if t < heizgrenze else load_ww for t in x_temps]
+    # Stützpunkte inkl. Bivalenzpunkt, damit die Backup-Fläche exakt dort endet
+    x_temps, y_loads = lastkurve_stuetzpunkte(norm_temp - 2, 20, load_b, load_ww, norm_temp, extra=(bivalenz_temp,))
     
     ax2.plot(x_temps, y_loads, label='Heizlast + WW', color='#36A9E1', linewidth=2)
     
@@ -275,13 +297,99 @@ def create_pdf_report(projekt, bearbeiter, firma, flaeche, bauweise, wm2, total_
     return bytes(pdf.output(dest='S'))
 
 # ==========================================
-# 2. MAIN APP
+# 2. BERECHNUNG & DIAGRAMME
+# ==========================================
+def berechne_auslegung(flaeche, wm2_wert, personen, ww_faktor, sperrzeit):
+    """Heizlast inkl. Sperrzeit-Zuschlag und Warmwasser (Modul 1)"""
+    laufzeit = 24 - sperrzeit
+    load_building_base = (flaeche * wm2_wert) / 1000
+    load_ww_base = personen * ww_faktor
+    sperr_faktor = 24 / laufzeit
+    load_building_real = load_building_base * sperr_faktor
+    total_kw = load_building_real + load_ww_base
+    sperr_aufschlag = load_building_real - load_building_base
+    return load_building_base, load_ww_base, sperr_faktor, load_building_real, total_kw, sperr_aufschlag
+
+def berechne_lastkurve(x_temps, load_b, load_ww, norm_temp, heizgrenze=HEIZGRENZE):
+    """Leistungsbedarf je Außentemperatur: WW-Grundlast + Gebäude unterhalb der Heizgrenze"""
+    x = np.asarray(x_temps, dtype=float)
+    return np.where(x < heizgrenze, load_b * (heizgrenze - x) / (heizgrenze - norm_temp) + load_ww, load_ww)
+
+def lastkurve_stuetzpunkte(x_min, x_max, load_b, load_ww, norm_temp, extra=(), heizgrenze=HEIZGRENZE):
+    """Die Kennlinie ist stückweise linear -> Ränder + Knick an der Heizgrenze (+ extra) genügen"""
+    x = np.unique(np.clip(np.array([x_min, heizgrenze, x_max, *extra], dtype=float), x_min, x_max))
+    return x, berechne_lastkurve(x, load_b, load_ww, norm_temp, heizgrenze)
+
+def plot_leistungs_pie(load_building_base, load_ww_base, sperr_aufschlag, speicher=None):
+    return diagramme.leistungs_pie_figur(load_building_base, load_ww_base, sperr_aufschlag, speicher)
+
+def plot_heizlast_verlauf(load_building_real, load_ww_base, norm_temp, bivalenz_punkt, speicher=None):
+    # Kalt links (-xx°C), warm rechts (+20°C), Knick an der Heizgrenze (15 Grad)
+    x_temps, y_loads = lastkurve_stuetzpunkte(norm_temp - 5, 20, load_building_real, load_ww_base, norm_temp)
+    return diagramme.heizlast_figur(x_temps, y_loads, load_ww_base, bivalenz_punkt, speicher)
+
+def kaskaden_teillast(load_building_real, load_ww_base, norm_temp, heizgrenze=HEIZGRENZE):
+    """Teillast-Kennlinie in 1-K-Schritten von der Normtemperatur bis zur Heizgrenze (für WP_Kaskade)"""
+    return berechne_lastkurve(np.arange(norm_temp, heizgrenze + 1), load_building_real, load_ww_base, norm_temp, heizgrenze)
+
+def erzeuge_pdf_download(*args):
+    """Wird erst beim Klick auf den Download-Button ausgeführt (eigener Thread)"""
+    with messung("modul1.pdf"):
+        return create_pdf_report(*args)
+
+def export_daten(projekt, bearbeiter, firma, flaeche, bauweise, wm2, total_kw,
+                 load_b, load_ww, sperr_kw, sperrzeit,
+                 norm_temp, vl_temp, system, bivalenz, backup_typ, infos, warnings, critical):
+    """Berichtsdaten für Excel/Word aus denselben Werten wie das PDF + Kennlinie in 1-K-Schritten"""
+    temps = np.arange(norm_temp, 21)
+    lasten = berechne_lastkurve(temps, load_b, load_ww, norm_temp)
+    kennlinie = [(int(t), float(kw), "nur Warmwasser" if t >= HEIZGRENZE else (f"WP + {backup_typ}" if t <= bivalenz else "WP"))
+                 for t, kw in zip(temps, lasten)]
+    return export.bericht_daten(projekt, bearbeiter, firma, flaeche, bauweise, wm2, total_kw,
+                                load_b, load_ww, sperr_kw, sperrzeit,
+                                norm_temp, vl_temp, system, bivalenz, backup_typ, infos, warnings, critical, kennlinie)
+
+def erzeuge_xlsx_download(*args):
+    with messung("modul1.xlsx"):
+        return export.auslegung_xlsx(export_daten(*args))
+
+def erzeuge_docx_download(*args):
+    with messung("modul1.docx"):
+        return export.auslegung_docx(export_daten(*args))
+
+def portfolio_zeilen(gebaeude):
+    """Ergebniszeilen (Reihenfolge wie export.PORTFOLIO_SPALTEN) für einen Gebäude-Iterator"""
+    for g in gebaeude:
+        base, load_ww, _, load_real, total_kw, sperr = berechne_auslegung(
+            g["flaeche"], g["wm2"], g["personen"], WW_FAKTOR, g["sperrzeit"])
+        last_7 = berechne_lastkurve([7], load_real, load_ww, g["norm_temp"])[0]
+        yield (g["projekt"], g["flaeche"], g["wm2"], g["personen"], g["sperrzeit"], g["norm_temp"],
+               round(base, 2), round(sperr, 2), round(load_ww, 2), round(total_kw, 2), round(float(last_7), 2))
+
+def erzeuge_portfolio_download(csv_daten):
+    with messung("modul1.portfolio_xlsx"):
+        return export.portfolio_xlsx(portfolio_zeilen(export.portfolio_aus_csv(csv_daten)))
+
+def portfolio_streuung(csv_daten):
+    """Fläche, Heizlast gesamt und Projekt je Gebäude (für das Streudiagramm im Portfolio-Export)
+    + Anzahl übersprungener Zeilen"""
+    flaechen, lasten, projekte = [], [], []
+    statistik = {}
+    for zeile in portfolio_zeilen(export.portfolio_aus_csv(csv_daten, statistik)):
+        projekte.append(zeile[0])
+        flaechen.append(zeile[1])
+        lasten.append(zeile[9])
+    return flaechen, lasten, projekte, statistik["uebersprungen"]
+
+# ==========================================
+# 3. MAIN APP
 # ==========================================
 def main():
     BG_COLOR = "#36A9E1"
     TEXT_MAIN = "#3C3C3B"
     INPUT_BG = "#FFFFFF"
     
+    t_css = time.perf_counter()
     st.markdown(f"""
         <style>
         @font-face {{ font-family: 'POE Vetica UI'; src: url('POE Vetica UI.ttf') format('truetype'); }}
@@ -303,6 +411,7 @@ def main():
         .result-highlight {{ font-size: 36px !important; font-weight: bold; }}
         </style>
     """, unsafe_allow_html=True)
+    erfassen_seit("modul1.css", t_css)
 
     col1, col2 = st.columns([2, 1])
     with col1:
@@ -311,12 +420,23 @@ def main():
         # Version direkt unter Modul 1
         st.markdown(f'<p class="header-text" style="font-size: 14px; opacity: 0.8; margin-top: 0px;">App Version: {APP_VERSION}</p>', unsafe_allow_html=True)
     with col2:
-        logo = "Coolsulting_Logo_ohneHG_outlines_weiß.png"
+        logo = asset("Coolsulting_Logo_ohneHG_outlines_weiß.png")
         if os.path.exists(logo):
             st.image(logo, width="stretch")
         st.markdown('<div class="modul-title">Auslegung</div>', unsafe_allow_html=True)
 
     st.write("---")
+    auslegung_cockpit()
+
+@st.fragment
+def auslegung_cockpit():
+    """Eingaben, Ergebnis, Diagramme und Bericht. Eine Widget-Änderung rerunnt nur
+    dieses Fragment (ohne CSS, Modul-Reload und Header der central STATION)."""
+    with profiliere_rerun(), rerun_messung("modul1.fragment"):
+        _cockpit_inhalt()
+
+def _cockpit_inhalt():
+    t_widgets = time.perf_counter()
 
     c_proj, c_bearb = st.columns(2)
     with c_proj:
@@ -365,7 +485,7 @@ def main():
         hat_ww = st.checkbox("Warmwasser über diese WP?", value=False, key="m1_ww")
         if hat_ww:
             personen = st.slider("Personen / Nutzer", 1, 20, 3, key="m1_pers")
-            ww_faktor = (1.45 * 2.0 * 365) / 2400
+            ww_faktor = WW_FAKTOR
         else:
             st.markdown(f"<span style='font-size:12px; color:white; opacity:0.7;'>Deaktiviert (z.B. externer Boiler)</span>", unsafe_allow_html=True)
             personen = 0
@@ -385,14 +505,15 @@ def main():
             backup_source = "Kessel (Bestand)"
 
     st.write("---")
+    erfassen_seit("modul1.widgets", t_widgets)
 
     if st.button("AUSLEGUNG BERECHNEN"):
-        load_building_base = (flaeche * wm2_wert) / 1000
-        load_ww_base = personen * ww_faktor
-        sperr_faktor = 24 / laufzeit
-        load_building_real = load_building_base * sperr_faktor
-        total_kw = load_building_real + load_ww_base
-        sperr_aufschlag = load_building_real - load_building_base
+        st.session_state.m1_berechnet = True
+
+    # Nach dem ersten Klick bleiben die Ergebnisse sichtbar und folgen jeder Eingabe live
+    if st.session_state.get("m1_berechnet"):
+        (load_building_base, load_ww_base, sperr_faktor,
+         load_building_real, total_kw, sperr_aufschlag) = berechne_auslegung(flaeche, wm2_wert, personen, ww_faktor, sperrzeit)
         
         infos, warnings, critical = [], [], []
         if flaeche > 300 and hat_ww: infos.append("ℹ️ <b>Gewerbe-Hinweis:</b> WW-Bedarf prüfen.")
@@ -424,47 +545,18 @@ def main():
 
         with res_c2:
             st.markdown('<p style="color:white; text-align:center; font-weight:bold; margin-top:20px;">Leistungs-Verteilung</p>', unsafe_allow_html=True)
-            labels = ['Gebäude', 'Warmwasser', 'Sperrzeit']
-            values = [load_building_base, load_ww_base, sperr_aufschlag]
-            colors = ['#FF4B4B', '#8B0000', '#3C3C3B']
-            
-            fig = go.Figure(data=[go.Pie(labels=labels, values=values, hole=.5, sort=False)])
-            fig.update_traces(marker=dict(colors=colors, line=dict(color='#FFFFFF', width=2)))
-            fig.update_layout(showlegend=False, paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', margin=dict(t=10, b=10, l=10, r=10))
+            with messung("modul1.plotly"):
+                fig = plot_leistungs_pie(load_building_base, load_ww_base, sperr_aufschlag, st.session_state)
             st.plotly_chart(fig, width="stretch")
 
         st.write("---")
         st.markdown("### 📊 Heizlast-Verlauf & Teilleistung")
         
-        # Berechnung Heizgrenze (15 Grad) und Kurven
-        # Kalt links (-xx°C), warm rechts (+20°C)
-        x_temps = np.linspace(norm_temp - 5, 20, 100)
-        heizgrenze = 15.0
-        
-        y_loads = [(load_building_real * (heizgrenze - t) / (heizgrenze - norm_temp)) + load_ww_base if t < heizgrenze else load_ww_base for t in x_temps]
-        
-        fig_biv = go.Figure()
-        fig_biv.add_trace(go.Scatter(x=x_temps, y=y_loads, mode='lines', name='Heizlast Gebäude + WW', line=dict(color='#36A9E1', width=3)))
-        
-        if load_ww_base > 0:
-            fig_biv.add_hline(y=load_ww_base, line_dash="dot", line_color="#8B0000", annotation_text=f"Warmwasser ({load_ww_base:.2f} kW)", annotation_position="bottom left")
-
-        # Annotation für die Übergangszeit passend zur normalen Leserichtung
-        fig_biv.add_vline(x=7, line_width=2, line_dash="dot", line_color="green", annotation_text="Übergang (+7°C)", annotation_position="top right")
-        fig_biv.add_vline(x=bivalenz_punkt, line_width=2, line_dash="dash", line_color="red", annotation_text="Bivalenzpunkt", annotation_position="top left")
-        
-        fig_biv.update_layout(
-            title="Leistungsbedarf über Außentemperatur",
-            xaxis_title="Außentemperatur (°C)",
-            yaxis_title="Leistung (kW)",
-            # autorange="reversed" wurde hier ENTFERNT -> Standard Ansicht (kalt nach warm)
-            paper_bgcolor='rgba(255,255,255,0.9)',
-            plot_bgcolor='rgba(255,255,255,0.9)',
-            height=400
-        )
+        with messung("modul1.plotly"):
+            fig_biv = plot_heizlast_verlauf(load_building_real, load_ww_base, norm_temp, bivalenz_punkt, st.session_state)
         st.plotly_chart(fig_biv, width="stretch")
         
-        last_uebergang = (load_building_real * (heizgrenze - 7) / (heizgrenze - norm_temp)) + load_ww_base if 7 < heizgrenze else load_ww_base
+        last_uebergang = berechne_lastkurve([7], load_building_real, load_ww_base, norm_temp)[0]
 
         st.markdown(f"""
         <div style="background-color:rgba(255,255,255,0.2); padding:10px; border-radius:5px; color:white; font-size:13px;">
@@ -477,13 +569,18 @@ def main():
         </div>
         """, unsafe_allow_html=True)
 
+        st.write("---")
+        st.markdown("### 🔗 Kaskade (mehrere Wärmepumpen)")
+        kaskaden_bereich(total_kw, load_building_real, load_ww_base, norm_temp)
+
         st.write("---")
         st.markdown("### 📄 Bericht")
         
         date_str = datetime.now().strftime("%Y-%m-%d")
-        file_name_pdf = f"Auslegung_{projekt.replace(' ', '_')}_{date_str}.pdf"
+        datei_basis = f"Auslegung_{projekt.replace(' ', '_')}_{date_str}"
 
-        pdf_bytes = create_pdf_report(
+        # Gleiche Werte für PDF, Excel und Word; gebaut wird erst beim Klick (PDF ~0,5 s)
+        bericht_args = (
             projekt if projekt else "Unbenannt",
             bearbeiter, firma,
             flaeche, bauweise_select, wm2_wert, total_kw,
@@ -491,13 +588,110 @@ def main():
             norm_temp, vl_temp, heizsystem, bivalenz_punkt, backup_source,
             infos, warnings, critical
         )
-        
-        st.download_button(
-            label="📄 PDF Report herunterladen",
-            data=pdf_bytes,
-            file_name=file_name_pdf,
-            mime="application/pdf"
+
+        d1, d2, d3 = st.columns(3)
+        with d1:
+            st.download_button(
+                label="📄 PDF Report herunterladen",
+                data=partial(erzeuge_pdf_download, *bericht_args),
+                file_name=f"{datei_basis}.pdf",
+                mime="application/pdf"
+            )
+        with d2:
+            st.download_button(
+                label="📊 Excel herunterladen",
+                data=partial(erzeuge_xlsx_download, *bericht_args),
+                file_name=f"{datei_basis}.xlsx",
+                mime=export.MIME_XLSX
+            )
+        with d3:
+            st.download_button(
+                label="📝 Word herunterladen",
+                data=partial(erzeuge_docx_download, *bericht_args),
+                file_name=f"{datei_basis}.docx",
+                mime=export.MIME_DOCX
+            )
+
+        with st.expander("📚 Portfolio-Export (viele Gebäude → eine Excel-Datei)"):
+            st.markdown('<span style="font-size:13px;">CSV mit einer Zeile pro Gebäude: '
+                        '<code>Projekt;Fläche;W/m²;Personen;Sperrzeit;Normtemp</code> '
+                        '(Personen, Sperrzeit und Normtemp optional, Standard 0 / 0 / -12 °C, Normtemp -25…0 °C; '
+                        'bei Semikolon deutsches Zahlenformat, z.B. 1.200,5).</span>', unsafe_allow_html=True)
+            portfolio = st.file_uploader("Gebäudeliste (CSV)", type=["csv"], key="m1_portfolio")
+            if portfolio is not None:
+                # Nur neu rechnen, wenn eine andere Datei hochgeladen wurde (Slider rerunnen das Cockpit)
+                if st.session_state.get("m1_portfolio_id") != portfolio.file_id:
+                    with messung("modul1.portfolio_streuung"):
+                        st.session_state["m1_portfolio_streuung"] = portfolio_streuung(portfolio.getvalue())
+                    st.session_state["m1_portfolio_id"] = portfolio.file_id
+                flaechen, lasten, projekte, uebersprungen = st.session_state["m1_portfolio_streuung"]
+                if uebersprungen:
+                    st.warning(f"{uebersprungen} Zeile(n) übersprungen (Zahlenformat, Fläche/Last ≤ 0, "
+                               f"Personen < 0, Sperrzeit außerhalb 0–23 h oder Normtemp außerhalb -25…0 °C).")
+                if flaechen:
+                    with messung("modul1.plotly"):
+                        fig_portfolio = diagramme.portfolio_streudiagramm(flaechen, lasten, projekte)
+                    st.plotly_chart(fig_portfolio, width="stretch", key="m1_portfolio_streu")
+                    st.download_button(
+                        label="📊 Portfolio als Excel herunterladen",
+                        data=partial(erzeuge_portfolio_download, portfolio.getvalue()),
+                        file_name=f"Portfolio_{date_str}.xlsx",
+                        mime=export.MIME_XLSX
+                    )
+                else:
+                    st.warning("Keine gültigen Gebäude in der CSV gefunden.")
+
+def kaskaden_bereich(total_kw, load_building_real, load_ww_base, norm_temp):
+    with st.expander("Günstigste Gerätekombination aus dem Katalog", expanded=total_kw > 30):
+        k1, k2 = st.columns([1.2, 0.8])
+        with k1:
+            upload = st.file_uploader("Eigener Katalog (CSV: Modell;kW max;kW min;Preis)", type=["csv"], key="m1_kat")
+        with k2:
+            max_geraete = st.slider("Max. Anzahl Geräte", 1, 8, kaskade.MAX_GERAETE, key="m1_kask_n")
+
+        # Katalog nur bei neuer Datei parsen; Cockpit-Reruns (Vorlauf, System, Projekttext) rechnen sonst jedes Mal neu
+        datei_id = upload.file_id if upload is not None else None
+        if "m1_katalog" not in st.session_state or st.session_state.get("m1_kat_id") != datei_id:
+            st.session_state["m1_katalog"] = kaskade.katalog_aus_csv(upload.getvalue()) if upload is not None else kaskade.beispiel_katalog()
+            st.session_state["m1_kat_id"] = datei_id
+        katalog = st.session_state["m1_katalog"]
+        if not katalog:
+            st.markdown('<div class="warning-box" style="color: #856404;">⚠️ Katalog enthält keine gültigen Zeilen.</div>', unsafe_allow_html=True)
+            return
+
+        teillast = kaskaden_teillast(load_building_real, load_ww_base, norm_temp)
+        schluessel = (round(total_kw, 2), tuple(np.round(teillast, 2)), datei_id, max_geraete)
+        memo = st.session_state.get("m1_kask_memo")
+        if memo is None or memo[0] != schluessel:
+            t_start = time.perf_counter()
+            with messung("modul1.kaskade"):
+                ergebnis = kaskade.optimiere_kaskade(total_kw, teillast, katalog, max_geraete)
+            memo = (schluessel, ergebnis, (time.perf_counter() - t_start) * 1000)
+            st.session_state["m1_kask_memo"] = memo
+        _, ergebnis, dauer_ms = memo
+
+        if ergebnis is None:
+            st.markdown(f'<div class="critical-box" style="color: #721C24;">⛔ Keine Kombination mit max. {max_geraete} Geräten deckt {total_kw:.2f} kW lückenlos ab.</div>', unsafe_allow_html=True)
+            return
+
+        zeilen = "".join(
+            f"• {anzahl} x <b>{g['modell']}</b> ({g['kw_min']:.1f} – {g['kw_max']:.1f} kW, {g['preis']:,.0f} EUR)<br>"
+            for anzahl, g in kaskade.zusammenfassen(ergebnis["geraete"])
         )
+        st.markdown(f"""
+        <div class="result-box">
+            <div class="tech-info">
+            <b>🔗 Empfohlene Kaskade ({len(ergebnis['geraete'])} Gerät{'e' if len(ergebnis['geraete']) > 1 else ''}):</b><br>
+            {zeilen}
+            • Leistung: <b>{ergebnis['kw_max']:.1f} kW</b> (Bedarf {ergebnis['auslegungslast']:.2f} kW) / kleinste Stufe {ergebnis['kw_min']:.1f} kW<br>
+            • Listenpreis gesamt: <b>{ergebnis['preis']:,.0f} EUR</b>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+        if not ergebnis["mindestlast_erreicht"]:
+            st.markdown(f'<div class="warning-box" style="color: #856404;">⚠️ Kein Gerät moduliert bis {ergebnis["mindestlast"]:.2f} kW (Sommer-Grundlast) – Pufferspeicher vorsehen.</div>', unsafe_allow_html=True)
+        st.caption(f"{len(katalog)} Modelle, {ergebnis['zustaende']} Suchzustände, {dauer_ms:.1f} ms"
+                   + ("" if upload is not None else " · Beispiel-Katalog mit Richtwerten, keine Herstellerpreise."))
 
 if __name__ == '__main__':
     main()
\ No newline at end of file